@@ -6,7 +6,22 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from rag_guardian.exceptions import ConfigurationError
+
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
+# ${VAR_NAME} references substituted in YAML config values
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Return the environment value for a ${VAR_NAME} match, or the match if unset."""
+    return os.environ.get(match.group(1), match.group(0))
 
 
 class MetricConfig(BaseModel):
@@ -49,6 +64,16 @@ class Config(BaseModel):
     rag_system: RAGSystemConfig = Field(default_factory=RAGSystemConfig)
     metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     reporting: ReportingConfig = Field(default_factory=ReportingConfig)
+    # Max test cases evaluated in parallel threads (None or 1 = sequential)
+    concurrency: int | None = None
+
+    @field_validator("concurrency")
+    @classmethod
+    def _check_concurrency(cls, value: int | None) -> int | None:
+        """Reject thread counts below 1."""
+        if value is not None and value < 1:
+            raise ConfigurationError(f"concurrency must be at least 1, got {value}")
+        return value
 
     @classmethod
     def from_yaml(cls, path: str) -> "Config":
@@ -58,7 +83,7 @@ class Config(BaseModel):
             raise FileNotFoundError(f"Config file not found: {path}")
 
         with open(yaml_path) as f:
-            raw_data = yaml.safe_load(f)
+            raw_data = yaml.load(f, Loader=_YAMLLoader)
 
         # Substitute environment variables
         raw_data = cls._substitute_env_vars(raw_data)
@@ -74,11 +99,9 @@ class Config(BaseModel):
             return [cls._substitute_env_vars(item) for item in data]
         elif isinstance(data, str):
             # Replace ${VAR_NAME} with environment variable value
-            def replace_env_var(match: re.Match[str]) -> str:
-                var_name = match.group(1)
-                return os.environ.get(var_name, match.group(0))
-
-            return re.sub(r"\$\{([^}]+)\}", replace_env_var, data)
+            if "${" not in data:
+                return data
+            return _ENV_VAR_PATTERN.sub(_replace_env_var, data)
         else:
             return data
 
@@ -1,11 +1,22 @@
 """Data loader for test cases."""
 
 import json
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import IO
 
 from rag_guardian.core.types import TestCase
 from rag_guardian.exceptions import DatasetError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Read/write buffer for JSONL files (the default 8 KiB means a syscall per few lines)
+IO_BUFFER_SIZE = 1 << 16
+
 
 class DataLoader:
     """
@@ -15,19 +26,60 @@ class DataLoader:
     """
 
     @staticmethod
-    def load_jsonl(file_path: str) -> list[TestCase]:
+    def load_jsonl(file_path: str | os.PathLike[str] | IO[str] | IO[bytes]) -> list[TestCase]:
         """
         Load test cases from JSONL file.
 
         Args:
-            file_path: Path to JSONL file
+            file_path: Path to JSONL file, or an open text/binary file-like object
 
         Returns:
             List of TestCase objects
 
         Raises:
             DatasetError: If file doesn't exist or parsing fails
+
+        Example:
+            >>> DataLoader.load_jsonl(io.StringIO('{"question": "What is RAG?"}\\n'))
+        """
+        if isinstance(file_path, (str, os.PathLike)):
+            source = os.fspath(file_path)
+            test_cases = list(DataLoader._iter_file(DataLoader._check_path(file_path)))
+        else:
+            source = getattr(file_path, "name", "<stream>")
+            test_cases = list(DataLoader._iter_stream(file_path, source))
+
+        if not test_cases:
+            raise DatasetError(f"No valid test cases found in {source}")
+
+        return test_cases
+
+    @staticmethod
+    def iter_jsonl(file_path: str | os.PathLike[str]) -> Iterator[TestCase]:
+        """
+        Stream test cases from JSONL file one line at a time.
+
+        The path is validated immediately; lines are read and parsed lazily,
+        so the whole dataset never has to be held in memory.
+
+        Args:
+            file_path: Path to JSONL file
+
+        Returns:
+            Iterator over TestCase objects
+
+        Raises:
+            DatasetError: If file doesn't exist or parsing fails
+
+        Example:
+            >>> for test_case in DataLoader.iter_jsonl("tests.jsonl"):
+            ...     print(test_case.question)
         """
+        return DataLoader._iter_file(DataLoader._check_path(file_path))
+
+    @staticmethod
+    def _check_path(file_path: str | os.PathLike[str]) -> Path:
+        """Check the dataset exists and has the .jsonl extension."""
         path = Path(file_path)
 
         if not path.exists():
@@ -36,36 +88,40 @@ class DataLoader:
         if path.suffix != ".jsonl":
             raise DatasetError(f"Expected .jsonl file, got: {path.suffix}")
 
-        test_cases = []
+        return path
+
+    @staticmethod
+    def _iter_file(path: Path) -> Iterator[TestCase]:
+        """Parse test cases from an already validated JSONL path."""
+        with open(path, "rb", buffering=IO_BUFFER_SIZE) as f:
+            yield from DataLoader._iter_stream(f, f"file {path}")
 
+    @staticmethod
+    def _iter_stream(lines: Iterable[str | bytes], name: str) -> Iterator[TestCase]:
+        """Parse test cases from the lines of an open JSONL file or stream."""
         try:
-            with open(path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, start=1):
-                    line = line.strip()
-
-                    if not line:  # Skip empty lines
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        test_case = DataLoader._parse_test_case(data, line_num)
-                        test_cases.append(test_case)
-                    except json.JSONDecodeError as e:
-                        raise DatasetError(f"Invalid JSON on line {line_num}: {str(e)}") from e
-                    except Exception as e:
-                        raise DatasetError(
-                            f"Error parsing test case on line {line_num}: {str(e)}"
-                        ) from e
+            for line_num, line in enumerate(lines, start=1):
+                line = line.strip()
+
+                if not line:  # Skip empty lines
+                    continue
+
+                try:
+                    data = orjson.loads(line) if orjson is not None else json.loads(line)
+                    test_case = DataLoader._parse_test_case(data, line_num)
+                except json.JSONDecodeError as e:
+                    raise DatasetError(f"Invalid JSON on line {line_num}: {str(e)}") from e
+                except Exception as e:
+                    raise DatasetError(
+                        f"Error parsing test case on line {line_num}: {str(e)}"
+                    ) from e
+
+                yield test_case
 
         except Exception as e:
             if isinstance(e, DatasetError):
                 raise
-            raise DatasetError(f"Error reading file {file_path}: {str(e)}") from e
-
-        if not test_cases:
-            raise DatasetError(f"No valid test cases found in {file_path}")
-
-        return test_cases
+            raise DatasetError(f"Error reading {name}: {str(e)}") from e
 
     @staticmethod
     def _parse_test_case(data: dict, line_num: int) -> TestCase:
@@ -106,7 +162,7 @@ class DataLoader:
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
+        with open(path, "wb", buffering=IO_BUFFER_SIZE) as f:
             for test_case in test_cases:
                 data = {
                     "question": test_case.question,
@@ -123,4 +179,9 @@ class DataLoader:
                 if test_case.forbidden_contexts:
                     data["forbidden_contexts"] = test_case.forbidden_contexts
 
-                f.write(json.dumps(data, ensure_ascii=False) + "\n")
+                if orjson is not None:
+                    f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+                else:
+                    # Same compact separators as orjson, so both write identical files
+                    line = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+                    f.write(line.encode("utf-8") + b"\n")
@@ -1,15 +1,19 @@
 """Main evaluation pipeline for RAG Guardian."""
 
-import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
 from pathlib import Path
 
-from rag_guardian.core.config import Config
+from rag_guardian.core.config import Config, MetricConfig
+from rag_guardian.core.loader import DataLoader
 from rag_guardian.core.types import (
     EvaluationResult,
     MetricScore,
     TestCase,
     TestCaseResult,
 )
+from rag_guardian.exceptions import DatasetError
 from rag_guardian.integrations.base import BaseRAGAdapter
 from rag_guardian.metrics.answer_correctness import AnswerCorrectnessMetric
 from rag_guardian.metrics.base import BaseMetric
@@ -20,6 +24,14 @@ from rag_guardian.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Built-in metrics, keyed by their section name in MetricsConfig
+METRIC_CLASSES: dict[str, type[BaseMetric]] = {
+    "faithfulness": FaithfulnessMetric,
+    "groundedness": GroundednessMetric,
+    "context_relevancy": ContextRelevancyMetric,
+    "answer_correctness": AnswerCorrectnessMetric,
+}
+
 
 class EvaluationPipeline:
     """
@@ -49,36 +61,19 @@ class EvaluationPipeline:
         self.metrics = self._initialize_metrics()
 
     def _initialize_metrics(self) -> dict[str, BaseMetric]:
-        """Initialize metrics based on config."""
+        """Initialize metrics based on config.
+
+        Metric objects are built once here and reused for every test case.
+        """
         metrics: dict[str, BaseMetric] = {}
 
-        # Faithfulness
-        if self.config.metrics.faithfulness.enabled:
-            metrics["faithfulness"] = FaithfulnessMetric(
-                threshold=self.config.metrics.faithfulness.threshold,
-                required=self.config.metrics.faithfulness.required,
-            )
-
-        # Groundedness
-        if self.config.metrics.groundedness.enabled:
-            metrics["groundedness"] = GroundednessMetric(
-                threshold=self.config.metrics.groundedness.threshold,
-                required=self.config.metrics.groundedness.required,
-            )
-
-        # Context Relevancy
-        if self.config.metrics.context_relevancy.enabled:
-            metrics["context_relevancy"] = ContextRelevancyMetric(
-                threshold=self.config.metrics.context_relevancy.threshold,
-                required=self.config.metrics.context_relevancy.required,
-            )
-
-        # Answer Correctness
-        if self.config.metrics.answer_correctness.enabled:
-            metrics["answer_correctness"] = AnswerCorrectnessMetric(
-                threshold=self.config.metrics.answer_correctness.threshold,
-                required=self.config.metrics.answer_correctness.required,
-            )
+        for metric_name, metric_cls in METRIC_CLASSES.items():
+            metric_config: MetricConfig = getattr(self.config.metrics, metric_name)
+            if metric_config.enabled:
+                metrics[metric_name] = metric_cls(
+                    threshold=metric_config.threshold,
+                    required=metric_config.required,
+                )
 
         return metrics
 
@@ -96,32 +91,32 @@ class EvaluationPipeline:
             {"question": "What is RAG?", "expected_answer": "Retrieval-Augmented Generation"}
             {"question": "How does it work?", "expected_answer": "Combines retrieval and generation"}
         """
-        test_cases = []
+        return list(self._read_test_cases(dataset_path))
+
+    def _iter_test_cases(self, dataset_path: str) -> Iterator[TestCase]:
+        """
+        Validate the whole dataset, then return a lazy iterator over its test cases.
+
+        The validation pass keeps nothing in memory; it only makes a missing file
+        or a malformed line fail before the first RAG call.
+        """
+        for _ in self._read_test_cases(dataset_path):
+            pass
+
+        return self._read_test_cases(dataset_path)
+
+    @staticmethod
+    def _read_test_cases(dataset_path: str) -> Iterator[TestCase]:
+        """Stream test cases through DataLoader, raising the pipeline's error types."""
         path = Path(dataset_path)
 
         if not path.exists():
             raise FileNotFoundError(f"Dataset not found: {dataset_path}")
 
-        with open(path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    test_case = TestCase(
-                        question=data["question"],
-                        expected_answer=data.get("expected_answer"),
-                        expected_contexts=data.get("expected_contexts"),
-                        acceptable_answers=data.get("acceptable_answers"),
-                        metadata=data.get("metadata", {}),
-                    )
-                    test_cases.append(test_case)
-                except (json.JSONDecodeError, KeyError) as e:
-                    raise ValueError(f"Invalid test case at line {line_num}: {e}") from e
-
-        return test_cases
+        try:
+            yield from DataLoader.iter_jsonl(path)
+        except DatasetError as e:
+            raise ValueError(f"Invalid test case in {dataset_path}: {e}") from e
 
     def evaluate_test_case(self, test_case: TestCase) -> TestCaseResult:
         """
@@ -161,41 +156,47 @@ class EvaluationPipeline:
             failure_reasons=failure_reasons,
         )
 
-    def evaluate_dataset(self, dataset_path: str | list[TestCase]) -> EvaluationResult:
+    def evaluate_dataset(self, dataset_path: str | Iterable[TestCase]) -> EvaluationResult:
         """
         Evaluate entire dataset.
 
+        A JSONL path is validated in full first, so a malformed line fails before
+        any RAG call, and then streamed line by line instead of being held in memory.
+
         Args:
-            dataset_path: Path to JSONL file with test cases or list of TestCase objects
+            dataset_path: Path to JSONL file with test cases or an iterable of TestCase objects
 
         Returns:
             EvaluationResult with all test results and summary
         """
-        # Load test cases - handle both file path and list of TestCase objects
-        if isinstance(dataset_path, list):
-            test_cases = dataset_path
+        # Load test cases - handle both file path and iterable of TestCase objects
+        if isinstance(dataset_path, (str, PathLike)):
+            test_cases = self._iter_test_cases(str(dataset_path))
+        else:
+            test_cases = iter(dataset_path)
+
+        # Evaluate each test case (in a thread pool when concurrency is configured)
+        concurrency = self.config.concurrency
+        if concurrency and concurrency > 1:
+            # Executor.map submits every case up front anyway; size the pool to fit
+            pending = list(test_cases)
+            max_workers = max(1, min(concurrency, len(pending)))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                outcomes = list(pool.map(self._try_evaluate_test_case, pending))
         else:
-            test_cases = self.load_test_cases(dataset_path)
+            outcomes = [self._try_evaluate_test_case(test_case) for test_case in test_cases]
 
-        if not test_cases:
-            source = "provided list" if isinstance(dataset_path, list) else dataset_path
+        if not outcomes:
+            source = dataset_path if isinstance(dataset_path, (str, PathLike)) else "provided list"
             raise ValueError(f"No test cases found in {source}")
 
-        # Evaluate each test case
-        results: list[TestCaseResult] = []
-        for test_case in test_cases:
-            try:
-                result = self.evaluate_test_case(test_case)
-                results.append(result)
-            except Exception as e:
-                # Create a failed result for exceptions
-                logger.error(f"Error evaluating test case: {e}")
-                # For now, we'll skip failed executions
-                # In production, you might want to create a failed TestCaseResult
-                continue
-
-        # Calculate summary statistics
-        summary = self._calculate_summary(results)
+        # For now, we'll skip failed executions
+        # In production, you might want to create a failed TestCaseResult
+        results = [result for result in outcomes if result is not None]
+
+        # Gather metric scores column-wise and calculate summary statistics
+        metric_columns = self._collect_metric_columns(results)
+        summary = self._calculate_summary(results, metric_columns)
 
         # Overall pass/fail (all tests must pass)
         overall_passed = all(r.passed for r in results)
@@ -206,7 +207,27 @@ class EvaluationPipeline:
             summary=summary,
         )
 
-    def _calculate_summary(self, results: list[TestCaseResult]) -> dict[str, float]:
+    def _try_evaluate_test_case(self, test_case: TestCase) -> TestCaseResult | None:
+        """Evaluate a test case, logging and returning None if it raises."""
+        try:
+            return self.evaluate_test_case(test_case)
+        except Exception as e:
+            logger.error(f"Error evaluating test case: {e}")
+            return None
+
+    def _collect_metric_columns(self, results: list[TestCaseResult]) -> dict[str, list[float]]:
+        """Collect the score values of each metric into one list per metric."""
+        columns: dict[str, list[float]] = {metric_name: [] for metric_name in self.metrics}
+        for r in results:
+            for metric_name, score in r.metric_scores.items():
+                column = columns.get(metric_name)
+                if column is not None:
+                    column.append(score.value)
+        return columns
+
+    def _calculate_summary(
+        self, results: list[TestCaseResult], metric_columns: dict[str, list[float]]
+    ) -> dict[str, float]:
         """Calculate summary statistics across all results."""
         if not results:
             return {}
@@ -214,12 +235,7 @@ class EvaluationPipeline:
         summary = {}
 
         # Average scores for each metric
-        for metric_name in self.metrics.keys():
-            scores = [
-                r.metric_scores[metric_name].value
-                for r in results
-                if metric_name in r.metric_scores
-            ]
+        for metric_name, scores in metric_columns.items():
             if scores:
                 summary[f"avg_{metric_name}"] = sum(scores) / len(scores)
 
@@ -266,12 +282,12 @@ class Evaluator:
         config = Config.from_yaml(config_path)
         return cls(rag_adapter, config)
 
-    def evaluate_dataset(self, dataset_path: str | list[TestCase]) -> EvaluationResult:
+    def evaluate_dataset(self, dataset_path: str | Iterable[TestCase]) -> EvaluationResult:
         """
         Evaluate a dataset.
 
         Args:
-            dataset_path: Path to JSONL test cases or list of TestCase objects
+            dataset_path: Path to JSONL test cases or an iterable of TestCase objects
 
         Returns:
             EvaluationResult
@@ -16,7 +16,7 @@ class MetricType(str, Enum):
     TOKEN_EFFICIENCY = "token_efficiency"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """A single test case for RAG evaluation.
 
@@ -59,7 +59,7 @@ class TestCase:
             raise ValueError("Question cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGOutput:
     """Output from a RAG system execution."""
 
@@ -81,7 +81,7 @@ class RAGOutput:
             raise ValueError("Contexts cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricScore:
     """Score for a single metric."""
 
@@ -97,7 +97,7 @@ class MetricScore:
             raise ValueError(f"Metric value must be between 0 and 1, got {self.value}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCaseResult:
     """Result for a single test case."""
 
@@ -110,9 +110,13 @@ class TestCaseResult:
     failure_reasons: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
-    """Complete evaluation results for a dataset."""
+    """Complete evaluation results for a dataset.
+
+    ``test_case_results`` is the source of truth: averages and counts are
+    derived from it on access, so they stay correct if it is edited.
+    """
 
     test_case_results: list[TestCaseResult]
     passed: bool
@@ -1,9 +1,38 @@
 """Base adapter for RAG systems."""
 
+import functools
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
 
 from rag_guardian.core.types import RAGOutput
 
+RetrieveFn = TypeVar("RetrieveFn", bound=Callable[[Any, str], list[str]])
+
+
+def _cache_retrieve(retrieve: RetrieveFn, maxsize: int) -> RetrieveFn:
+    """
+    Wrap a retrieve method in an LRU cache keyed on the query string.
+
+    Each adapter instance gets its own cache, created on first use and stored on
+    the instance, so caches (and the adapters they reference) are freed together
+    with the adapter rather than living on the class.
+    """
+
+    @functools.wraps(retrieve)
+    def wrapper(self: Any, query: str) -> list[str]:
+        caches = self.__dict__.setdefault("_retrieve_caches", {})
+        cached = caches.get(wrapper)
+        if cached is None:
+            cached = caches.setdefault(
+                wrapper, functools.lru_cache(maxsize=maxsize)(functools.partial(retrieve, self))
+            )
+        # Hand out a copy so callers cannot mutate the cached contexts
+        return list(cached(query))
+
+    wrapper._retrieve_cache_size = maxsize  # type: ignore[attr-defined]
+    return cast(RetrieveFn, wrapper)
+
 
 class BaseRAGAdapter(ABC):
     """
@@ -11,8 +40,27 @@ class BaseRAGAdapter(ABC):
 
     Adapters connect RAG Guardian to different RAG implementations
     (LangChain, LlamaIndex, custom systems, etc.)
+
+    Deterministic adapters can opt in to caching ``retrieve`` results per
+    query string by passing ``cache`` (the LRU size) when subclassing. The
+    cache is per instance and is stored in the instance ``__dict__``.
+
+    Example:
+        >>> class MyRAG(BaseRAGAdapter, cache=128):
+        ...     def retrieve(self, query: str) -> list[str]:
+        ...         return search_index(query)
+        ...
+        ...     def generate(self, query: str, contexts: list[str]) -> str:
+        ...         return call_llm(query, contexts)
     """
 
+    def __init_subclass__(cls, cache: int = 0, **kwargs: Any) -> None:
+        """Wrap ``retrieve`` in an LRU cache of ``cache`` entries if requested."""
+        super().__init_subclass__(**kwargs)
+        # An inherited retrieve that is already cached is left as it is
+        if cache > 0 and not hasattr(cls.retrieve, "_retrieve_cache_size"):
+            cls.retrieve = _cache_retrieve(cls.retrieve, cache)  # type: ignore[method-assign]
+
     @abstractmethod
     def retrieve(self, query: str) -> list[str]:
         """
@@ -1,17 +1,24 @@
 """HTML reporting for RAG Guardian."""
 
+import functools
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
 from rag_guardian.core.types import EvaluationResult
 
+# Write buffer for report files; fragments are flushed in a few large writes
+WRITE_BUFFER_SIZE = 1 << 16
+
 
 class HTMLReporter:
     """Generate beautiful HTML reports from evaluation results."""
 
     @staticmethod
     def generate(
-        result: EvaluationResult, output_path: str, title: str = "RAG Quality Report"
+        result: EvaluationResult,
+        output_path: str,
+        title: str = "RAG Quality Report",
     ) -> None:
         """
         Generate HTML report.
@@ -24,25 +31,34 @@ class HTMLReporter:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate HTML content
-        html = HTMLReporter._generate_html(result, title)
+        # Stream HTML fragments into a 64 KiB write buffer
+        with open(output_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(HTMLReporter._iter_html(result, title))
+
+    @staticmethod
+    def render(result: EvaluationResult, title: str = "RAG Quality Report") -> str:
+        """
+        Render HTML report to a string without writing it to disk.
+
+        Args:
+            result: Evaluation results
+            title: Report title
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html)
+        Returns:
+            The complete HTML document
+        """
+        return "".join(HTMLReporter._iter_html(result, title))
 
     @staticmethod
-    def _generate_html(result: EvaluationResult, title: str) -> str:
-        """Generate complete HTML document."""
-        # Build HTML sections
-        header = HTMLReporter._build_header(title)
-        summary = HTMLReporter._build_summary(result)
-        metrics = HTMLReporter._build_metrics_table(result)
-        failures = HTMLReporter._build_failures(result)
-        test_details = HTMLReporter._build_test_details(result)
-
-        # Combine into full HTML
-        html = f"""<!DOCTYPE html>
+    def _iter_html(result: EvaluationResult, title: str, minimal: bool = False) -> Iterator[str]:
+        """
+        Yield the complete HTML document fragment by fragment.
+
+        ``minimal`` keeps only the summary and metrics table, leaving out the
+        failures, per-test details and scripts; it exists for tests that only
+        check a report gets written.
+        """
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -52,19 +68,26 @@ class HTMLReporter:
 </head>
 <body>
     <div class="container">
-        {header}
-        {summary}
-        {metrics}
-        {failures}
-        {test_details}
+        {HTMLReporter._build_header(title)}
+        {HTMLReporter._build_summary(result)}
+        {HTMLReporter._build_metrics_table(result)}
+        """
+        if not minimal:
+            yield from HTMLReporter._iter_failures(result)
+            yield from HTMLReporter._iter_test_details(result)
+        yield HTMLReporter._page_end(minimal)
+
+    @staticmethod
+    @functools.cache
+    def _page_end(minimal: bool) -> str:
+        """Build the static end of the page once and reuse it for every report."""
+        return f"""
         {HTMLReporter._build_footer()}
     </div>
-    {HTMLReporter._get_scripts()}
+    {"" if minimal else HTMLReporter._get_scripts()}
 </body>
 </html>"""
 
-        return html
-
     @staticmethod
     def _build_header(title: str) -> str:
         """Build header section."""
@@ -108,7 +131,7 @@ class HTMLReporter:
     @staticmethod
     def _build_metrics_table(result: EvaluationResult) -> str:
         """Build metrics summary table."""
-        rows = ""
+        rows: list[str] = []
 
         # Extract metric names from first test case
         if result.test_case_results:
@@ -124,7 +147,7 @@ class HTMLReporter:
 
                 metric_display = metric_name.replace("_", " ").title()
 
-                rows += f"""
+                rows.append(f"""
                 <tr class="{row_class}">
                     <td>{status_icon}</td>
                     <td>{metric_display}</td>
@@ -136,7 +159,7 @@ class HTMLReporter:
                         </div>
                     </td>
                 </tr>
-                """
+                """)
 
         return f"""
         <section class="metrics">
@@ -152,23 +175,26 @@ class HTMLReporter:
                     </tr>
                 </thead>
                 <tbody>
-                    {rows}
+                    {"".join(rows)}
                 </tbody>
             </table>
         </section>
         """
 
     @staticmethod
-    def _build_failures(result: EvaluationResult) -> str:
-        """Build failures section."""
+    def _iter_failures(result: EvaluationResult) -> Iterator[str]:
+        """Yield failures section fragments."""
         if not result.failures:
-            return ""
+            return
 
-        failure_items = ""
+        yield f"""
+        <section class="failures">
+            <h2>⚠️ Failed Tests ({len(result.failures)})</h2>
+            """
         for i, failure in enumerate(result.failures, 1):
             reasons = "<br>".join(f"• {reason}" for reason in failure.failure_reasons)
 
-            failure_items += f"""
+            yield f"""
             <div class="failure-item">
                 <h4>❌ Test {i}: {failure.test_case.question}</h4>
                 <div class="failure-details">
@@ -179,38 +205,36 @@ class HTMLReporter:
                 </div>
             </div>
             """
-
-        return f"""
-        <section class="failures">
-            <h2>⚠️ Failed Tests ({len(result.failures)})</h2>
-            {failure_items}
+        yield """
         </section>
         """
 
     @staticmethod
-    def _build_test_details(result: EvaluationResult) -> str:
-        """Build detailed test results."""
-        test_items = ""
-
+    def _iter_test_details(result: EvaluationResult) -> Iterator[str]:
+        """Yield detailed test results fragments."""
+        yield """
+        <section class="test-details">
+            <h2>📝 Detailed Test Results</h2>
+            """
         for i, test_result in enumerate(result.test_case_results, 1):
             status_class = "test-pass" if test_result.passed else "test-fail"
             status_icon = "✅" if test_result.passed else "❌"
 
             # Build metrics for this test
-            metrics_html = "<div class='test-metrics'>"
+            metric_items: list[str] = []
             for metric_name, score in test_result.metric_scores.items():
                 metric_class = "metric-pass" if score.passed else "metric-fail"
                 metric_display = metric_name.replace("_", " ").title()
 
-                metrics_html += f"""
+                metric_items.append(f"""
                 <div class='metric-item {metric_class}'>
                     <span class='metric-name'>{metric_display}:</span>
                     <span class='metric-value'>{score.value:.3f}</span>
                 </div>
-                """
-            metrics_html += "</div>"
+                """)
+            metrics_html = f"<div class='test-metrics'>{''.join(metric_items)}</div>"
 
-            test_items += f"""
+            yield f"""
             <details class="test-detail {status_class}">
                 <summary>
                     <span class="test-status">{status_icon}</span>
@@ -226,11 +250,7 @@ class HTMLReporter:
                 </div>
             </details>
             """
-
-        return f"""
-        <section class="test-details">
-            <h2>📝 Detailed Test Results</h2>
-            {test_items}
+        yield """
         </section>
         """
 
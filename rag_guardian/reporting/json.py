@@ -7,6 +7,11 @@ from typing import Any
 
 from rag_guardian.core.types import EvaluationResult, TestCaseResult
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 class JSONReporter:
     """Generate JSON reports from evaluation results."""
@@ -20,8 +25,7 @@ class JSONReporter:
             result: Evaluation result to save
             output_path: Path to output JSON file
         """
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file = JSONReporter._prepare_output(output_path)
 
         # Convert to JSON-serializable format
         data = JSONReporter._to_dict(result)
@@ -32,9 +36,21 @@ class JSONReporter:
             "version": "1.0.0",
         }
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to file - orjson when installed, stdlib json otherwise
+        if orjson is not None:
+            output_file.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _prepare_output(output_path: str) -> Path:
+        """Resolve output path and make sure its parent directory exists."""
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        return output_file
 
     @staticmethod
     def load(input_path: str) -> dict[str, Any]:
@@ -47,8 +63,12 @@ class JSONReporter:
         Returns:
             Dictionary with evaluation data
         """
+        if orjson is not None:
+            data: dict[str, Any] = orjson.loads(Path(input_path).read_bytes())
+            return data
+
         with open(input_path, encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
+            data = json.load(f)
             return data
 
     @staticmethod
@@ -149,8 +169,7 @@ class CompactJSONReporter(JSONReporter):
     @staticmethod
     def save(result: EvaluationResult, output_path: str) -> None:
         """Save compact JSON report."""
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file = JSONReporter._prepare_output(output_path)
 
         data = {
             "summary": result.summary,
@@ -158,5 +177,9 @@ class CompactJSONReporter(JSONReporter):
             "timestamp": datetime.now().isoformat(),
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # No indentation - use orjson when installed, compact separators otherwise
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
@@ -1,9 +1,12 @@
 """Utility modules for RAG Guardian."""
 
 from rag_guardian.utils.logging import (
+    debug_enabled,
     disable_logging,
     enable_file_logging,
     get_logger,
+    info_enabled,
+    reload_env_level,
     set_log_level,
 )
 
@@ -12,4 +15,7 @@ __all__ = [
     "set_log_level",
     "disable_logging",
     "enable_file_logging",
+    "reload_env_level",
+    "debug_enabled",
+    "info_enabled",
 ]
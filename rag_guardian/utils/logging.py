@@ -4,25 +4,463 @@ This module provides a centralized logging configuration for the entire project.
 All components should use get_logger(__name__) instead of print() statements.
 """
 
+import atexit
+import io
 import logging
 import os
+import queue
 import sys
+import threading
+import weakref
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Any, TextIO
 
 # Default log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Console buffering: records are written in batches instead of one write() each
+BUFFER_CAPACITY = 512
+FLUSH_INTERVAL = 0.2
+
+# File logging: user-space buffer size, so small records coalesce into large writes
+FILE_BUFFER_SIZE = 1 << 16
+
+# Level names accepted from the environment and set_log_level()
+_LEVEL_MAP: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+    "NOTSET": logging.NOTSET,
+}
+
+LOG_LEVEL_ENV_VAR = "RAG_GUARDIAN_LOG_LEVEL"
+
+# "1" writes records in the calling thread, "0" hands them to the background listener
+LOG_SYNC_ENV_VAR = "RAG_GUARDIAN_LOG_SYNC"
+
+# Longest time a WARNING (or higher) record waits for the listener to write it
+WRITE_TIMEOUT = 1.0
+
+
+def _read_env_level() -> int:
+    """Read the log level from the environment."""
+    return _LEVEL_MAP.get(os.environ.get(LOG_LEVEL_ENV_VAR, "INFO").upper(), logging.INFO)
+
+
+def _read_env_sync() -> bool:
+    """
+    Read whether console output is synchronous from the environment.
+
+    Defaults to synchronous when stdout is not a terminal (pipes, files,
+    captured output in tests), where stdout's own buffer already batches
+    writes and records must interleave correctly with print()/click output.
+    """
+    value = os.environ.get(LOG_SYNC_ENV_VAR)
+    if value is not None:
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    try:
+        return sys.stdout is None or not sys.stdout.isatty()
+    except ValueError:  # stdout already closed
+        return True
+
+
+# Level used when none is given, snapshotted from the environment once at import
+_DEFAULT_LEVEL = _read_env_level()
+_sync_output = _read_env_sync()
+
+# Package logger holding the handlers; module loggers propagate to it
+ROOT_LOGGER_NAME = "rag_guardian"
+_CHILD_PREFIX = ROOT_LOGGER_NAME + "."
+
 # Global configuration
-_loggers: dict[str, logging.Logger] = {}
-_configured = False
+# Weak registry: logging's own manager keeps loggers alive, no second strong reference
+_loggers: "weakref.WeakValueDictionary[str, logging.Logger]" = weakref.WeakValueDictionary()
+
+# Guards configuration changes; re-entrant because children build the package logger
+_config_lock = threading.RLock()
+_file_handlers: dict[str, logging.Handler] = {}
+
+# Cached level gates for hot call sites, see debug_enabled()/info_enabled()
+_debug_enabled = _DEFAULT_LEVEL <= logging.DEBUG
+_info_enabled = _DEFAULT_LEVEL <= logging.INFO
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to the stream's own buffer.
+
+    The stdlib handler flushes after every record; here only WARNING and
+    above are flushed immediately, everything else is written out when the
+    buffer fills or the handler is flushed explicitly.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write record, flushing only for WARNING and above."""
+        try:
+            self._write_record(self.format(record))
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Format a burst of records and write them with a single write()."""
+        parts = []
+        terminator = self.terminator
+        for record in records:
+            if record.levelno < self.level or not self.filter(record):
+                continue
+            try:
+                # Terminator is joined in below rather than copied onto each message
+                parts.append(self.format(record))
+                parts.append(terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+
+        if not parts:
+            return
+
+        self.acquire()
+        try:
+            self._write("".join(parts))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+    def _write_record(self, msg: str) -> None:
+        """Write one formatted record without building ``msg + terminator``."""
+        stream = self.stream
+        stream.write(msg)
+        stream.write(self.terminator)
+
+    def _write(self, text: str) -> None:
+        """Write formatted text to the stream."""
+        self.stream.write(text)
+
+
+class _BufferedFileHandler(_BufferedStreamHandler, logging.FileHandler):
+    """
+    FileHandler writing pre-encoded UTF-8 bytes through a large write buffer.
+
+    The file is opened in binary mode, so records are encoded once here and
+    skip the TextIOWrapper layer entirely.
+    """
+
+    stream: Any  # Binary buffered writer, see _open()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._terminator_bytes = self._encode(self.terminator)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Open the file on first use when created with ``delay=True``."""
+        if self._ensure_stream():
+            super().emit(record)
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Open the file on first use, then write the batch."""
+        if self._ensure_stream():
+            super().handle_batch(records)
+
+    def _ensure_stream(self) -> bool:
+        """Open the delayed stream unless the handler was closed; return whether it is open."""
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:  # type: ignore[attr-defined]
+                self.stream = self._open()
+        return bool(self.stream)
+
+    def _encode(self, text: str) -> bytes:
+        return text.encode(self.encoding or "utf-8", self.errors or "strict")
+
+    def _write_record(self, msg: str) -> None:
+        """Write the encoded record followed by the pre-encoded terminator."""
+        stream = self.stream
+        stream.write(self._encode(msg))
+        stream.write(self._terminator_bytes)
+
+    def _write(self, text: str) -> None:
+        """Encode and write formatted text to the binary stream."""
+        self.stream.write(self._encode(text))
+
+    def _open(self) -> io.BufferedWriter:  # type: ignore[override]
+        mode = self.mode if "b" in self.mode else self.mode + "b"
+        return open(self.baseFilename, mode, buffering=FILE_BUFFER_SIZE)  # type: ignore[return-value]
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter specialised for LOG_FORMAT with a per-second timestamp cache.
+
+    DATE_FORMAT has one-second resolution, so consecutive records in the
+    same second share a single ``time.strftime`` call. For the default
+    LOG_FORMAT, plain records are rendered with an f-string instead of
+    %-style substitution over ``record.__dict__``.
+    """
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt, datefmt)
+        self._cached_time: tuple[int, str] = (-1, "")
+        self._fast_path = fmt == LOG_FORMAT
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record, using the LOG_FORMAT fast path when possible."""
+        if not self._fast_path or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format record time, reusing the previous result within the same second."""
+        if datefmt is None:
+            # Default format includes milliseconds, nothing to reuse
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+
+        text = super().formatTime(record, datefmt)
+        self._cached_time = (second, text)
+        return text
+
+
+class _StdoutHandler(_BufferedStreamHandler):
+    """Stream handler that always writes to the current ``sys.stdout``."""
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self) -> TextIO:
+        """Resolve stdout at write time so buffered records follow redirection."""
+        return sys.stdout
+
+
+class _TimedMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes shortly after the first buffered record.
+
+    Records are flushed when the buffer is full, when a WARNING (or higher)
+    record arrives, or ``flush_interval`` seconds after buffering started,
+    so low-volume output still shows up promptly. Remaining records are
+    flushed by ``logging.shutdown`` at interpreter exit. A buffered stream
+    target receives each burst as one joined write.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = BUFFER_CAPACITY,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer record and schedule a flush if none is pending."""
+        super().emit(record)
+        if self.buffer and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Flush buffered records to the target and cancel the pending timer."""
+        self.acquire()
+        try:
+            if isinstance(self.target, _BufferedStreamHandler):
+                self.target.handle_batch(self.buffer)
+                self.buffer.clear()
+            else:
+                super().flush()
+            if self.target:
+                self.target.flush()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        finally:
+            self.release()
+
+
+# Shared by every output handler; records are formatted on the listener thread only
+_FORMATTER = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
+# Console handler shared by the listener and synchronous mode
+_stdout_handler = _StdoutHandler()
+_stdout_handler.setFormatter(_FORMATTER)
+
+
+def _handle_sync(record: logging.LogRecord) -> None:
+    """Write a record in the calling thread, bypassing the listener."""
+    for handler in (_stdout_handler, *_file_handlers.values()):
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+class _Listener(QueueListener):
+    """QueueListener that wakes up callers waiting for their record to be written."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle the record, then signal its waiter, if any."""
+        super().handle(record)
+        written = record.__dict__.get("written")
+        if written is not None:
+            written.set()
+
+
+# Loggers only enqueue records; a single background listener does the I/O
+class _ListenerQueueHandler(QueueHandler):
+    """
+    QueueHandler feeding the background listener, started on the first record.
+
+    WARNING and above block until the listener has written them, so they
+    show up in order and before the logging call returns. In synchronous
+    mode (see LOG_SYNC_ENV_VAR) records skip the queue altogether.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write synchronously, or enqueue and wait for WARNING and above."""
+        if _sync_output:
+            _handle_sync(record)
+            return
+        if record.levelno < logging.WARNING:
+            super().emit(record)
+            return
+
+        written = threading.Event()
+        try:
+            prepared = self.prepare(record)
+            prepared.written = written
+            self.enqueue(prepared)
+        except Exception:
+            self.handleError(record)
+            return
+
+        # Never wait on a stopped listener or from the listener thread itself
+        thread = _listener._thread if _listener is not None else None
+        if thread is not None and thread is not threading.current_thread():
+            written.wait(WRITE_TIMEOUT)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Start the listener if needed, then enqueue the record."""
+        if _listener is None:
+            _get_listener()
+        super().enqueue(record)
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = _ListenerQueueHandler(_log_queue)
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+
+
+def _get_listener() -> QueueListener:
+    """Return the queue listener owning the output handlers, starting it once."""
+    global _listener
+
+    # The config lock keeps enable_file_logging() from registering a handler
+    # between reading _file_handlers and publishing the listener
+    with _listener_lock, _config_lock:
+        if _listener is None:
+            # File handlers survive a fork, so a child's new listener picks them up again
+            _listener = _Listener(
+                _log_queue,
+                _TimedMemoryHandler(_stdout_handler),
+                *_file_handlers.values(),
+                respect_handler_level=True,
+            )
+            _listener.start()
+
+    return _listener
+
+
+def _stop_listener() -> None:
+    """Drain the queue and stop the listener of this process, if one was started."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _flush_before_fork() -> None:
+    """
+    Write out queued and buffered records before the process forks.
+
+    Otherwise the child inherits copies of the console and file buffers and
+    writes the parent's records a second time when it flushes at exit. The
+    listener is stopped to drain the queue and restarted in the parent by
+    _restart_after_fork().
+    """
+    listener = _listener
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+    # Synchronous mode writes straight to these
+    _stdout_handler.flush()
+    for handler in _file_handlers.values():
+        handler.flush()
+
+
+def _restart_after_fork() -> None:
+    """Restart the parent's listener stopped by _flush_before_fork()."""
+    if _listener is not None:
+        _listener.start()
+
+
+def _reset_after_fork() -> None:
+    """
+    Forget the parent's listener in a forked child process.
+
+    The listener thread does not exist in the child, so records would pile up
+    in a queue nobody reads. The child gets a fresh queue and locks (either may
+    have been held by another thread at fork time); the next record starts a
+    new listener.
+    """
+    global _listener, _log_queue, _listener_lock, _config_lock
+
+    _listener = None
+    _log_queue = queue.SimpleQueue()
+    _queue_handler.queue = _log_queue
+    _listener_lock = threading.Lock()
+    _config_lock = threading.RLock()
+
+
+# Drain the queue before logging.shutdown flushes the handlers
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_flush_before_fork,
+        after_in_parent=_restart_after_fork,
+        after_in_child=_reset_after_fork,
+    )
 
 
 def get_logger(name: str, level: int | None = None) -> logging.Logger:
     """
     Get a configured logger for RAG Guardian.
 
-    This function returns a logger configured with appropriate handlers
-    and formatters. Loggers are cached to avoid duplicate configuration.
+    Handlers are configured once, on the package-level "rag_guardian"
+    logger; module loggers below it (``rag_guardian.*``) carry no handlers
+    of their own and propagate to it. Other names get the shared handler
+    directly and start at the package logger's level. Loggers are cached
+    to avoid duplicate configuration.
 
     Args:
         name: Logger name (typically __name__ from calling module)
@@ -38,45 +476,115 @@ def get_logger(name: str, level: int | None = None) -> logging.Logger:
         >>> logger.info("Starting evaluation")
         >>> logger.error("Failed to load dataset")
     """
-    global _configured
+    # Fast path: already built
+    cached = _loggers.get(name)
+    if cached is not None:
+        if level is not None:
+            cached.setLevel(level)
+        return cached
+
+    with _config_lock:
+        # Another thread may have built it while we waited
+        cached = _loggers.get(name)
+        if cached is not None:
+            if level is not None:
+                cached.setLevel(level)
+            return cached
+
+        logger = logging.getLogger(name)
+
+        if name.startswith(_CHILD_PREFIX):
+            # Module loggers inherit level and handlers from the package logger
+            get_logger(ROOT_LOGGER_NAME)
+            logger.propagate = True
+            if level is not None:
+                logger.setLevel(level)
+        else:
+            if level is None:
+                # Follow set_log_level()/disable_logging() applied to the package logger
+                root = _loggers.get(ROOT_LOGGER_NAME)
+                level = _DEFAULT_LEVEL if root is None else root.level
+            logger.setLevel(level)
+
+            # Hand records to the background listener, which writes them in batches.
+            # The listener itself is only started once something is logged.
+            if _queue_handler not in logger.handlers:
+                logger.addHandler(_queue_handler)
+
+            # Prevent propagation to root logger
+            logger.propagate = False
+
+        # Cache logger
+        _loggers[name] = logger
+
+        return logger
+
+
+def reload_env_level() -> None:
+    """
+    Re-read the default log level from RAG_GUARDIAN_LOG_LEVEL.
 
-    # Return cached logger if exists
-    if name in _loggers:
-        return _loggers[name]
+    The environment variables are read once at import time; call this after
+    changing them at runtime (e.g. in tests). The level applies to the
+    package logger and to loggers created afterwards. RAG_GUARDIAN_LOG_SYNC
+    is re-read as well.
 
-    # Create logger
-    logger = logging.getLogger(name)
+    Example:
+        >>> import os
+        >>> from rag_guardian.utils.logging import reload_env_level
+        >>> os.environ["RAG_GUARDIAN_LOG_LEVEL"] = "DEBUG"
+        >>> reload_env_level()
+    """
+    global _DEFAULT_LEVEL, _sync_output
+
+    _DEFAULT_LEVEL = _read_env_level()
+    _sync_output = _read_env_sync()
+    _update_level_gates(_DEFAULT_LEVEL)
 
-    # Only configure if not already configured
-    if not _configured or not logger.handlers:
-        # Determine log level
-        if level is None:
-            # Check environment variable
-            env_level = os.getenv("RAG_GUARDIAN_LOG_LEVEL", "INFO").upper()
-            level = getattr(logging, env_level, logging.INFO)
+    root = _loggers.get(ROOT_LOGGER_NAME)
+    if root is not None:
+        root.setLevel(_DEFAULT_LEVEL)
 
-        logger.setLevel(level)
 
-        # Create console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
+def _apply_level(level: int) -> None:
+    """Set level on configured loggers and clear overrides on module loggers."""
+    # Build the package logger first so loggers requested later inherit the level
+    get_logger(ROOT_LOGGER_NAME)
+    for name, logger in list(_loggers.items()):
+        logger.setLevel(logging.NOTSET if name.startswith(_CHILD_PREFIX) else level)
 
-        # Create formatter
-        formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-        console_handler.setFormatter(formatter)
 
-        # Add handler to logger
-        logger.addHandler(console_handler)
+def _update_level_gates(level: int) -> None:
+    """Refresh the cached debug/info gates for the given global level."""
+    global _debug_enabled, _info_enabled
 
-        # Prevent propagation to root logger
-        logger.propagate = False
+    _debug_enabled = level <= logging.DEBUG
+    _info_enabled = level <= logging.INFO
 
-        _configured = True
 
-    # Cache logger
-    _loggers[name] = logger
+def debug_enabled() -> bool:
+    """
+    Check whether DEBUG logging is enabled globally.
 
-    return logger
+    Lets hot call sites skip building expensive log messages entirely.
+    Reflects the level from RAG_GUARDIAN_LOG_LEVEL, set_log_level() and
+    disable_logging(); per-logger overrides are not taken into account.
+
+    Example:
+        >>> from rag_guardian.utils.logging import debug_enabled
+        >>> if debug_enabled():
+        ...     logger.debug(f"Contexts: {expensive_repr(contexts)}")
+    """
+    return _debug_enabled
+
+
+def info_enabled() -> bool:
+    """
+    Check whether INFO logging is enabled globally.
+
+    See debug_enabled() for details.
+    """
+    return _info_enabled
 
 
 def set_log_level(level: str) -> None:
@@ -90,52 +598,66 @@ def set_log_level(level: str) -> None:
         >>> from rag_guardian.utils.logging import set_log_level
         >>> set_log_level("DEBUG")
     """
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
-
-    for logger in _loggers.values():
-        logger.setLevel(numeric_level)
-        for handler in logger.handlers:
-            handler.setLevel(numeric_level)
+    numeric_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
+    _update_level_gates(numeric_level)
+    _apply_level(numeric_level)
 
 
 def disable_logging() -> None:
     """
     Disable all RAG Guardian logging output.
 
-    Useful for testing or when running in quiet mode.
+    Useful for testing or when running in quiet mode. Loggers requested
+    afterwards inherit the disabled level; set_log_level() re-enables all
+    of them.
 
     Example:
         >>> from rag_guardian.utils.logging import disable_logging
         >>> disable_logging()
     """
-    for logger in _loggers.values():
-        logger.setLevel(logging.CRITICAL + 1)
+    _update_level_gates(logging.CRITICAL + 1)
+    _apply_level(logging.CRITICAL + 1)
 
 
 def enable_file_logging(file_path: str, level: int | None = None) -> None:
     """
     Enable logging to file in addition to console.
 
+    Records are filtered by logger level; a handler level is only set when
+    ``level`` is given. Calling this again with the same path reuses the
+    existing handler and only updates its level. Records reach the file
+    within FLUSH_INTERVAL seconds, WARNING and above immediately.
+
     Args:
         file_path: Path to log file
-        level: Optional log level for file handler
+        level: Optional extra level threshold for the file handler
 
     Example:
         >>> from rag_guardian.utils.logging import enable_file_logging
         >>> enable_file_logging("rag_guardian.log")
     """
-    if level is None:
-        env_level = os.getenv("RAG_GUARDIAN_LOG_LEVEL", "INFO").upper()
-        level = getattr(logging, env_level, logging.INFO)
-
-    # Create file handler
-    file_handler = logging.FileHandler(file_path)
-    file_handler.setLevel(level)
-
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-    file_handler.setFormatter(formatter)
-
-    # Add to all existing loggers
-    for logger in _loggers.values():
-        logger.addHandler(file_handler)
+    key = os.path.abspath(file_path)
+
+    with _config_lock:
+        # Reuse the handler if this file is already being logged to
+        existing = _file_handlers.get(key)
+        if existing is not None:
+            if level is not None:
+                existing.setLevel(level)
+            return
+
+        # Create file handler, opened on the first record. Like the console, it
+        # sits behind a timed buffer so INFO records reach disk within FLUSH_INTERVAL.
+        file_target = _BufferedFileHandler(key, encoding="utf-8", delay=True)
+        file_target.setFormatter(_FORMATTER)
+        file_handler = _TimedMemoryHandler(file_target)
+        if level is not None:
+            file_handler.setLevel(level)
+        _file_handlers[key] = file_handler
+
+        # Swap in a new tuple rather than mutating: the listener thread may be
+        # iterating the current one, and it keeps doing so undisturbed. A
+        # listener started later picks the handler up from _file_handlers.
+        listener = _listener
+        if listener is not None:
+            listener.handlers = (*listener.handlers, file_handler)
@@ -10,63 +10,61 @@ Usage:
 """
 
 import argparse
-import json
-from datetime import datetime
+import functools
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-
-class PromotionGenerator:
-    """Generator contentу promocyjnego dla RAG Guardian."""
-
-    def __init__(self):
-        self.project_name = "RAG Guardian"
-        self.tagline = "Przestań zgadywać czy twój RAG działa. Przetestuj go."
-        self.repo_url = "https://github.com/gacabartosz/rag-guardian"
-        self.pypi_url = "https://pypi.org/project/rag-guardian/"
-        self.website = "https://bartoszgaca.pl"
-
-        # Metryki projektu
-        self.stats = {
-            "tests": 119,
-            "coverage": 68,
-            "frameworks": ["LangChain", "LlamaIndex"],
-            "metrics": 4,
-            "version": "1.0.0"
-        }
-
-    def generate_twitter_thread(self):
-        """Thread na Twitter/X (seria tweetów)."""
-        tweets = [
-            # Tweet 1 - Hook
-            f"""🚀 RAG Guardian v1.0 - pytest dla systemów RAG
+# Separatory sekcji w plikach i na konsoli
+_SEP60 = "=" * 60
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+
+# Podsumowanie wypisywane po --platform all
+_FILES_CREATED = """
+Files created:
+  - twitter_thread.txt
+  - linkedin_post.md
+  - r_MachineLearning.md
+  - r_Python.md
+  - r_LangChain.md
+  - devto_article.md
+  - submission_list.json
+  - PROMOTION_CHECKLIST.md"""
+
+# "r/Python" -> "r_Python" w nazwach plików
+_FILENAME_TABLE = str.maketrans({"/": "_"})
+
+# Tweety z placeholderami {tests}, {coverage}, {stats_block}, {repo_url}
+# (patrz PromotionGenerator._params)
+TWEET_TEMPLATES = (
+    # Tweet 1 - Hook
+    """🚀 RAG Guardian v1.0 - pytest dla systemów RAG
 
 Wdrażasz RAG do produkcji i zastanawiasz się "czy to czasem nie halucynuje?"
 
 Teraz możesz to PRZETESTOWAĆ zanim klient zobaczy błąd.
 
 Thread 🧵👇""",
-
-            # Tweet 2 - Problem
-            """Problem który znam z autopsji:
+    # Tweet 2 - Problem
+    """Problem który znam z autopsji:
 
 ❌ 2h ręcznego sprawdzania przed każdym release
 ❌ "Coś nie gra" ale nie wiesz co
 ❌ Klient zgłasza bug na prodzie
 
 Brzmi znajomo?""",
-
-            # Tweet 3 - Rozwiązanie
-            f"""Rozwiązanie → automatyczne testy RAG:
+    # Tweet 3 - Rozwiązanie
+    """Rozwiązanie → automatyczne testy RAG:
 
 ✅ 4 metryki (faithfulness, groundedness, relevancy, correctness)
 ✅ 5 minut zamiast 2h
 ✅ Raport HTML do pokazania szefowi
 ✅ CI/CD - blokuje merge jak testy failują
 
-{self.repo_url}""",
-
-            # Tweet 4 - Jak działa
-            """Jak to działa? 3 komendy:
+{repo_url}""",
+    # Tweet 4 - Jak działa
+    """Jak to działa? 3 komendy:
 
 ```bash
 pip install rag-guardian
@@ -76,9 +74,8 @@ rag-guardian test --dataset tests.jsonl
 
 Dostajesz DOKŁADNIE co się zepsuło.
 Nie "coś nie gra" - konkretne "context_relevancy: 0.68 < 0.75" ⬅️ FIX THIS""",
-
-            # Tweet 5 - Integracje
-            """Działa z:
+    # Tweet 5 - Integracje
+    """Działa z:
 • LangChain (3 linijki kodu)
 • LlamaIndex (3 adaptery)
 • Custom RAG (dziedzicz CustomRAGAdapter)
@@ -86,19 +83,16 @@ Nie "coś nie gra" - konkretne "context_relevancy: 0.68 < 0.75" ⬅️ FIX THIS"
 
 Nie musisz zmieniać swojego kodu.
 Opakowujesz w adapter, uruchamiasz testy. Done.""",
+    # Tweet 6 - Stats
+    """Stats które pokazują że to działa:
 
-            # Tweet 6 - Stats
-            f"""Stats które pokazują że to działa:
-
-• {self.stats['tests']} testów passing
-• {self.stats['coverage']}% code coverage
+{stats_block}
 • Battle-tested w prawdziwych projektach
 • Open-source, MIT, free forever
 
-{self.repo_url}""",
-
-            # Tweet 7 - CTA
-            f"""Jeśli budujesz systemy RAG i masz dość zgadywania:
+{repo_url}""",
+    # Tweet 7 - CTA
+    """Jeśli budujesz systemy RAG i masz dość zgadywania:
 
 ⭐ Star na GitHubie jeśli to ma sens
 📦 pip install rag-guardian
@@ -106,14 +100,12 @@ Opakowujesz w adapter, uruchamiasz testy. Done.""",
 
 Real-world ROI: 1 bug złapany przed prod = kilka godzin saved.
 
-{self.repo_url}"""
-        ]
+{repo_url}""",
+)
 
-        return tweets
 
-    def generate_linkedin_post(self):
-        """Post na LinkedIn (długi format)."""
-        return f"""🚀 Czy Twój system RAG faktycznie działa? A może halucynuje i nie wiesz o tym?
+# Post na LinkedIn (placeholdery jak w TWEET_TEMPLATES, literalne klamry jako {{ }})
+LINKEDIN_TEMPLATE = """🚀 Czy Twój system RAG faktycznie działa? A może halucynuje i nie wiesz o tym?
 
 Właśnie wypuściłem RAG Guardian v1.0 - open-source narzędzie do testowania jakości systemów RAG.
 
@@ -145,8 +137,7 @@ Dostajesz:
 
 📊 METRYKI:
 
-• {self.stats['tests']} testów passing
-• {self.stats['coverage']}% code coverage
+{stats_block}
 • LangChain + LlamaIndex support out-of-the-box
 • Custom RAG? 3 metody do implementacji
 
@@ -165,7 +156,7 @@ ROI: Jeden bug złapany przed prod = kilka godzin saved na debugging i hotfix.
 
 🌟 DOSTĘPNE TERAZ:
 
-• GitHub: {self.repo_url}
+• GitHub: {repo_url}
 • PyPI: pip install rag-guardian
 • Open-source, MIT license
 • Dokumentacja + examples included
@@ -176,159 +167,12 @@ Jeśli budujesz systemy RAG i chcesz przestać zgadywać czy działają - sprawd
 
 ---
 
-Made by Bartosz Gaca | AI & Automation Strategist | {self.website}
-"""
-
-    def generate_reddit_posts(self):
-        """Posty na różne subreddity."""
-        posts = {
-            "r/MachineLearning": {
-                "title": "[P] RAG Guardian - Automated Testing Framework for RAG Systems",
-                "body": f"""**TL;DR:** Open-source tool to test RAG quality before production. Like pytest but for RAG systems. {self.stats['tests']} tests, {self.stats['coverage']}% coverage, LangChain + LlamaIndex support.
-
-**Problem:**
-
-Deploying RAG systems is scary. You test manually, push to prod, and hope it doesn't hallucinate. When it does, you find out from users.
-
-**Solution:**
-
-Automated RAG quality tests with clear metrics:
-- **Faithfulness** - Is the model making stuff up?
-- **Groundedness** - Is it using retrieved context?
-- **Context Relevancy** - Is retrieval finding the right docs?
-- **Answer Correctness** - Does it match expected answers?
-
-**Quick Start:**
-
-```bash
-pip install rag-guardian
-rag-guardian init
-rag-guardian test --dataset tests.jsonl
-```
-
-**Features:**
-
-- Works with LangChain, LlamaIndex, or custom RAG
-- HTML + JSON reports
-- CI/CD integration (GitHub Actions examples included)
-- {self.stats['tests']} passing tests, {self.stats['coverage']}% coverage
-
-**Example Output:**
-
-```
-✅ faithfulness        : 0.92 (threshold: 0.85)
-✅ groundedness        : 0.88 (threshold: 0.80)
-❌ context_relevancy   : 0.68 (threshold: 0.75)  ← FIX THIS
-✅ answer_correctness  : 0.90 (threshold: 0.80)
-```
-
-**Links:**
-
-- GitHub: {self.repo_url}
-- PyPI: {self.pypi_url}
-- License: MIT (free forever)
-
-**Looking for feedback** on the metrics implementation and what features would be most useful for v1.1.
-
-Currently using keyword matching (fast, ~80-85% accuracy). Planning semantic similarity with embeddings for v1.1 (~90-95% accuracy but slower).
-
-What would you prioritize?
+Made by Bartosz Gaca | AI & Automation Strategist | {website}
 """
-            },
-
-            "r/Python": {
-                "title": "RAG Guardian - Testing framework for RAG systems (LangChain, LlamaIndex)",
-                "body": f"""Built this tool to solve a problem I had: testing RAG quality before production.
 
-**What it does:**
-
-Tests your RAG system like pytest tests your code. You give it test cases (questions + expected answers), it runs them, gives you pass/fail with metrics.
 
-**Example:**
-
-```python
-from rag_guardian import Evaluator, TestCase
-
-tests = [
-    TestCase(
-        question="What's your return policy?",
-        expected_answer="30 days, no questions asked"
-    )
-]
-
-evaluator = Evaluator.from_config(".rag-guardian.yml")
-results = evaluator.evaluate_dataset(tests)
-
-if not results.passed:
-    print(f"Failed {{results.failed_tests}} tests")
-    exit(1)
-```
-
-**Integrations:**
-
-Works with LangChain and LlamaIndex out of the box. Custom RAG? Implement 2 methods (`retrieve` and `generate`).
-
-**Stats:**
-
-- {self.stats['tests']} tests passing
-- {self.stats['coverage']}% code coverage
-- Full CI/CD support
-- HTML + JSON reports
-
-**Links:**
-
-- Repo: {self.repo_url}
-- Install: `pip install rag-guardian`
-
-Open to feedback and PRs!
-"""
-            },
-
-            "r/LangChain": {
-                "title": "Testing RAG quality with LangChain - automated framework",
-                "body": f"""If you're building RAG with LangChain and wondering how to test it before production, check this out.
-
-**Problem:** Manual testing is time-consuming and you still miss edge cases.
-
-**Solution:** Automated tests with metrics (faithfulness, groundedness, etc.)
-
-**Integration (3 lines):**
-
-```python
-from langchain.chains import RetrievalQA
-from rag_guardian.integrations import LangChainAdapter
-
-qa_chain = RetrievalQA.from_chain_type(...)  # Your existing chain
-
-adapter = LangChainAdapter(qa_chain)
-evaluator = Evaluator(adapter)
-results = evaluator.evaluate_dataset("tests.jsonl")
-```
-
-**What it tests:**
-
-- Faithfulness (hallucinations)
-- Groundedness (using context)
-- Context relevancy (retrieval quality)
-- Answer correctness (vs expected)
-
-**Output:** HTML report + JSON for CI/CD
-
-GitHub: {self.repo_url}
-PyPI: `pip install rag-guardian`
-
-{self.stats['tests']} tests, {self.stats['coverage']}% coverage, MIT license.
-
-Feedback welcome!
-"""
-            }
-        }
-
-        return posts
-
-    def generate_devto_article(self):
-        """Artykuł na Dev.to (długi format)."""
-        return f"""---
+# Artykuł na Dev.to (placeholdery jak w TWEET_TEMPLATES, literalne klamry jako {{ }})
+DEVTO_TEMPLATE = """---
 title: Stop Guessing if Your RAG Works - Test It Like Code
 published: true
 description: Open-source framework to automatically test RAG system quality before production
@@ -533,8 +377,8 @@ jobs:
 
 ## Stats
 
-- ✅ {self.stats['tests']} tests passing
-- ✅ {self.stats['coverage']}% code coverage
+- ✅ {tests} tests passing
+- ✅ {coverage}% code coverage
 - ✅ LangChain + LlamaIndex support
 - ✅ HTML + JSON reports
 - ✅ Battle-tested in real projects
@@ -559,7 +403,7 @@ jobs:
 
 ## Links
 
-- **GitHub:** {self.repo_url}
+- **GitHub:** {repo_url}
 - **PyPI:** `pip install rag-guardian`
 - **Docs:** Full README with examples
 - **License:** MIT - free forever
@@ -574,250 +418,559 @@ If you're building RAG systems and tired of guessing if they work - try this.
 
 **Cost:** €0. Open-source.
 
-⭐ Star on GitHub if this makes sense: {self.repo_url}
+⭐ Star on GitHub if this makes sense: {repo_url}
 
 ---
 
-*Made by [Bartosz Gaca]({self.website}) | AI & Automation Strategist*
+*Made by [Bartosz Gaca]({website}) | AI & Automation Strategist*
 """
 
-    def generate_submission_list(self):
-        """Lista miejsc gdzie zgłosić projekt."""
-        submissions = {
-            "Agregatory projektów": [
-                {
-                    "name": "Hacker News (Show HN)",
-                    "url": "https://news.ycombinator.com/submit",
-                    "title": "Show HN: RAG Guardian – pytest for RAG systems",
-                    "tips": "Post rano US time (9-11am EST). Odpowiadaj na komentarze szybko.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "Product Hunt",
-                    "url": "https://www.producthunt.com/posts/new",
-                    "title": "RAG Guardian - Test your RAG before production",
-                    "tips": "Launch w środę/czwartek. Przygotuj tagline, screenshots, demo video.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "Indie Hackers",
-                    "url": "https://www.indiehackers.com/post/new",
-                    "title": "Built RAG Guardian - testing framework for RAG systems",
-                    "tips": "Share journey, numbers, lessons learned. Community lubi personal stories.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "Lobsters",
-                    "url": "https://lobste.rs/",
-                    "title": "RAG Guardian: Testing framework for RAG systems",
-                    "tips": "Tag: 'python', 'ai'. Technical audience, appreciate quality code.",
-                    "priority": "⭐ MEDIUM"
-                }
-            ],
-
-            "Reddit": [
-                {
-                    "name": "r/MachineLearning",
-                    "url": "https://reddit.com/r/MachineLearning/submit",
-                    "title": "[P] RAG Guardian - Testing framework for RAG systems",
-                    "tips": "Tag [P] for Project. Technical details, benchmarks. Monday-Wednesday best.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "r/Python",
-                    "url": "https://reddit.com/r/Python/submit",
-                    "title": "RAG Guardian - Testing framework for RAG systems",
-                    "tips": "Show code examples, API design. Community values Pythonic code.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "r/LangChain",
-                    "url": "https://reddit.com/r/LangChain/submit",
-                    "title": "Testing RAG quality with LangChain - automated framework",
-                    "tips": "Focus na LangChain integration. Show real examples.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "r/LocalLLaMA",
-                    "url": "https://reddit.com/r/LocalLLaMA/submit",
-                    "title": "RAG Guardian - test your local RAG systems",
-                    "tips": "Mention że działa z local models, nie tylko API.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "r/opensource",
-                    "url": "https://reddit.com/r/opensource/submit",
-                    "title": "RAG Guardian - open-source RAG testing framework",
-                    "tips": "Highlight MIT license, contribution guidelines, community aspect.",
-                    "priority": "⚡ LOW"
-                }
-            ],
-
-            "Dev Communities": [
-                {
-                    "name": "Dev.to",
-                    "url": "https://dev.to/new",
-                    "title": "Stop Guessing if Your RAG Works - Test It Like Code",
-                    "tips": "Long-form article. Tutorial style. Use code examples.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "Hashnode",
-                    "url": "https://hashnode.com/create/story",
-                    "title": "Building RAG Guardian: Testing RAG Systems Automatically",
-                    "tips": "Technical deep-dive. Behind the scenes, architecture.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "Medium",
-                    "url": "https://medium.com/new-story",
-                    "title": "How to Test RAG Systems Before Production",
-                    "tips": "Cross-post from Dev.to. Tag: Python, AI, Testing.",
-                    "priority": "⚡ LOW"
-                }
-            ],
-
-            "AI/ML Communities": [
-                {
-                    "name": "Papers with Code",
-                    "url": "https://paperswithcode.com/",
-                    "title": "Add to RAG evaluation tools",
-                    "tips": "Jeśli masz benchmarks/metrics comparison.",
-                    "priority": "⚡ LOW"
-                },
-                {
-                    "name": "Hugging Face Hub",
-                    "url": "https://huggingface.co/new-space",
-                    "title": "RAG Guardian Demo Space",
-                    "tips": "Stwórz interactive demo. Streamlit app showing evaluation.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "AI Discord servers",
-                    "url": "LangChain, LlamaIndex official Discords",
-                    "title": "Share in #show-and-tell channels",
-                    "tips": "Don't spam. Share value, help others.",
-                    "priority": "⭐ MEDIUM"
-                }
-            ],
-
-            "Twitter/X": [
-                {
-                    "name": "Tweet thread",
-                    "url": "https://twitter.com/compose/tweet",
-                    "title": "Use generated thread from this script",
-                    "tips": "Post 10-11am US Eastern. Tag @langchainai @llama_index. Use hashtags.",
-                    "priority": "🔥 HIGH"
-                },
-                {
-                    "name": "Tag influencers",
-                    "url": "In replies",
-                    "title": "@swyx @GergelyOrosz @llama_index @LangChainAI",
-                    "tips": "Don't spam. Genuinely ask for feedback if relevant.",
-                    "priority": "⚡ LOW"
-                }
-            ],
-
-            "Newsletters": [
-                {
-                    "name": "TLDR AI",
-                    "url": "https://tldr.tech/ai/submit",
-                    "title": "Submit via form",
-                    "tips": "Newsletter z 500k+ subscribers. Worth a shot.",
-                    "priority": "⭐ MEDIUM"
-                },
-                {
-                    "name": "Python Weekly",
-                    "url": "https://www.pythonweekly.com/submit",
-                    "title": "Submit your project",
-                    "tips": "Quality threshold high. Highlight testing aspect.",
-                    "priority": "⭐ MEDIUM"
-                }
-            ]
+
+@dataclass(slots=True, frozen=True)
+class RedditPost:
+    """Post na subreddit."""
+
+    title: str
+    body: str
+
+
+@dataclass(slots=True, frozen=True)
+class Submission:
+    """Miejsce do zgłoszenia projektu."""
+
+    name: str
+    url: str
+    title: str
+    tips: str
+    priority: str
+
+
+# Miejsca do zgłoszenia projektu (stałe, współdzielone między wywołaniami)
+_SUBMISSIONS = {
+    "Agregatory projektów": (
+        Submission(
+            name="Hacker News (Show HN)",
+            url="https://news.ycombinator.com/submit",
+            title="Show HN: RAG Guardian – pytest for RAG systems",
+            tips="Post rano US time (9-11am EST). Odpowiadaj na komentarze szybko.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="Product Hunt",
+            url="https://www.producthunt.com/posts/new",
+            title="RAG Guardian - Test your RAG before production",
+            tips="Launch w środę/czwartek. Przygotuj tagline, screenshots, demo video.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="Indie Hackers",
+            url="https://www.indiehackers.com/post/new",
+            title="Built RAG Guardian - testing framework for RAG systems",
+            tips="Share journey, numbers, lessons learned. Community lubi personal stories.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="Lobsters",
+            url="https://lobste.rs/",
+            title="RAG Guardian: Testing framework for RAG systems",
+            tips="Tag: 'python', 'ai'. Technical audience, appreciate quality code.",
+            priority="⭐ MEDIUM",
+        ),
+    ),
+    "Reddit": (
+        Submission(
+            name="r/MachineLearning",
+            url="https://reddit.com/r/MachineLearning/submit",
+            title="[P] RAG Guardian - Testing framework for RAG systems",
+            tips="Tag [P] for Project. Technical details, benchmarks. Monday-Wednesday best.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="r/Python",
+            url="https://reddit.com/r/Python/submit",
+            title="RAG Guardian - Testing framework for RAG systems",
+            tips="Show code examples, API design. Community values Pythonic code.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="r/LangChain",
+            url="https://reddit.com/r/LangChain/submit",
+            title="Testing RAG quality with LangChain - automated framework",
+            tips="Focus na LangChain integration. Show real examples.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="r/LocalLLaMA",
+            url="https://reddit.com/r/LocalLLaMA/submit",
+            title="RAG Guardian - test your local RAG systems",
+            tips="Mention że działa z local models, nie tylko API.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="r/opensource",
+            url="https://reddit.com/r/opensource/submit",
+            title="RAG Guardian - open-source RAG testing framework",
+            tips="Highlight MIT license, contribution guidelines, community aspect.",
+            priority="⚡ LOW",
+        ),
+    ),
+    "Dev Communities": (
+        Submission(
+            name="Dev.to",
+            url="https://dev.to/new",
+            title="Stop Guessing if Your RAG Works - Test It Like Code",
+            tips="Long-form article. Tutorial style. Use code examples.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="Hashnode",
+            url="https://hashnode.com/create/story",
+            title="Building RAG Guardian: Testing RAG Systems Automatically",
+            tips="Technical deep-dive. Behind the scenes, architecture.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="Medium",
+            url="https://medium.com/new-story",
+            title="How to Test RAG Systems Before Production",
+            tips="Cross-post from Dev.to. Tag: Python, AI, Testing.",
+            priority="⚡ LOW",
+        ),
+    ),
+    "AI/ML Communities": (
+        Submission(
+            name="Papers with Code",
+            url="https://paperswithcode.com/",
+            title="Add to RAG evaluation tools",
+            tips="Jeśli masz benchmarks/metrics comparison.",
+            priority="⚡ LOW",
+        ),
+        Submission(
+            name="Hugging Face Hub",
+            url="https://huggingface.co/new-space",
+            title="RAG Guardian Demo Space",
+            tips="Stwórz interactive demo. Streamlit app showing evaluation.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="AI Discord servers",
+            url="LangChain, LlamaIndex official Discords",
+            title="Share in #show-and-tell channels",
+            tips="Don't spam. Share value, help others.",
+            priority="⭐ MEDIUM",
+        ),
+    ),
+    "Twitter/X": (
+        Submission(
+            name="Tweet thread",
+            url="https://twitter.com/compose/tweet",
+            title="Use generated thread from this script",
+            tips="Post 10-11am US Eastern. Tag @langchainai @llama_index. Use hashtags.",
+            priority="🔥 HIGH",
+        ),
+        Submission(
+            name="Tag influencers",
+            url="In replies",
+            title="@swyx @GergelyOrosz @llama_index @LangChainAI",
+            tips="Don't spam. Genuinely ask for feedback if relevant.",
+            priority="⚡ LOW",
+        ),
+    ),
+    "Newsletters": (
+        Submission(
+            name="TLDR AI",
+            url="https://tldr.tech/ai/submit",
+            title="Submit via form",
+            tips="Newsletter z 500k+ subscribers. Worth a shot.",
+            priority="⭐ MEDIUM",
+        ),
+        Submission(
+            name="Python Weekly",
+            url="https://www.pythonweekly.com/submit",
+            title="Submit your project",
+            tips="Quality threshold high. Highlight testing aspect.",
+            priority="⭐ MEDIUM",
+        ),
+    ),
+}
+
+
+def _dump_submissions(submissions):
+    """Serializuje listę zgłoszeń do JSON (UTF-8, wcięcie 2 spacje)."""
+    # Import dopiero tutaj: orjson sam ładuje json/datetime, a tylko --platform all go potrzebuje
+    try:
+        import orjson
+    except ImportError:  # orjson jest opcjonalny, fallback na stdlib json
+        orjson = None
+
+    if orjson is not None:
+        return orjson.dumps(submissions, option=orjson.OPT_INDENT_2)
+    import json
+
+    serializable = {
+        category: [asdict(item) for item in items] for category, items in submissions.items()
+    }
+    return json.dumps(serializable, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@functools.cache
+def _submissions_json():
+    """Bajty submission_list.json, liczone raz (_SUBMISSIONS się nie zmienia)."""
+    return _dump_submissions(_SUBMISSIONS)
+
+
+def _write_file(path, content):
+    """Zapisuje str (UTF-8) albo gotowe bajty jednym wywołaniem."""
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding="utf-8")
+
+
+async def _write_files(output_dir, files):
+    """Zapisuje pliki (nazwa, content) równolegle, każdy w wątku z puli asyncio."""
+    import asyncio
+
+    await asyncio.gather(
+        *(asyncio.to_thread(_write_file, output_dir / name, content) for name, content in files)
+    )
+
+
+def _memoized(method):
+    """Zapamiętuje wynik generatora w self._cache (content zależy tylko od __init__)."""
+
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._cache[method.__name__]
+        except KeyError:
+            result = self._cache[method.__name__] = method(self)
+            return result
+
+    return wrapper
+
+
+class PromotionGenerator:
+    """Generator contentу promocyjnego dla RAG Guardian."""
+
+    __slots__ = (
+        "project_name",
+        "tagline",
+        "repo_url",
+        "pypi_url",
+        "website",
+        "tests",
+        "coverage",
+        "frameworks",
+        "metrics",
+        "version",
+        "_params",
+        "_cache",
+    )
+
+    def __init__(self):
+        self.project_name = "RAG Guardian"
+        self.tagline = "Przestań zgadywać czy twój RAG działa. Przetestuj go."
+        self.repo_url = "https://github.com/gacabartosz/rag-guardian"
+        self.pypi_url = "https://pypi.org/project/rag-guardian/"
+        self.website = "https://bartoszgaca.pl"
+
+        # Metryki projektu
+        self.tests = 119
+        self.coverage = 68
+        self.frameworks = ["LangChain", "LlamaIndex"]
+        self.metrics = 4
+        self.version = "1.0.0"
+
+        # Wartości podstawiane do szablonów
+        self._params = {
+            "tests": self.tests,
+            "coverage": self.coverage,
+            # Wspólny blok statystyk (tweet 6 i LinkedIn)
+            "stats_block": f"• {self.tests} testów passing\n• {self.coverage}% code coverage",
+            "repo_url": self.repo_url,
+            "website": self.website,
         }
 
-        return submissions
+        # Wygenerowany content (wypełniany przez @_memoized)
+        self._cache = {}
+
+    @_memoized
+    def generate_twitter_thread(self):
+        """Thread na Twitter/X (seria tweetów)."""
+        return [template.format_map(self._params) for template in TWEET_TEMPLATES]
+
+    @_memoized
+    def generate_linkedin_post(self):
+        """Post na LinkedIn (długi format)."""
+        return LINKEDIN_TEMPLATE.format_map(self._params)
+
+    @_memoized
+    def generate_reddit_posts(self):
+        """Posty na różne subreddity."""
+        posts = (
+            (
+                "r/MachineLearning",
+                RedditPost(
+                    title="[P] RAG Guardian - Automated Testing Framework for RAG Systems",
+                    body=f"""**TL;DR:** Open-source tool to test RAG quality before production. Like pytest but for RAG systems. {self.tests} tests, {self.coverage}% coverage, LangChain + LlamaIndex support.
+
+**Problem:**
+
+Deploying RAG systems is scary. You test manually, push to prod, and hope it doesn't hallucinate. When it does, you find out from users.
+
+**Solution:**
+
+Automated RAG quality tests with clear metrics:
+- **Faithfulness** - Is the model making stuff up?
+- **Groundedness** - Is it using retrieved context?
+- **Context Relevancy** - Is retrieval finding the right docs?
+- **Answer Correctness** - Does it match expected answers?
+
+**Quick Start:**
+
+```bash
+pip install rag-guardian
+rag-guardian init
+rag-guardian test --dataset tests.jsonl
+```
+
+**Features:**
+
+- Works with LangChain, LlamaIndex, or custom RAG
+- HTML + JSON reports
+- CI/CD integration (GitHub Actions examples included)
+- {self.tests} passing tests, {self.coverage}% coverage
+
+**Example Output:**
+
+```
+✅ faithfulness        : 0.92 (threshold: 0.85)
+✅ groundedness        : 0.88 (threshold: 0.80)
+❌ context_relevancy   : 0.68 (threshold: 0.75)  ← FIX THIS
+✅ answer_correctness  : 0.90 (threshold: 0.80)
+```
+
+**Links:**
+
+- GitHub: {self.repo_url}
+- PyPI: {self.pypi_url}
+- License: MIT (free forever)
+
+**Looking for feedback** on the metrics implementation and what features would be most useful for v1.1.
+
+Currently using keyword matching (fast, ~80-85% accuracy). Planning semantic similarity with embeddings for v1.1 (~90-95% accuracy but slower).
+
+What would you prioritize?
+""",
+                ),
+            ),
+            (
+                "r/Python",
+                RedditPost(
+                    title="RAG Guardian - Testing framework for RAG systems (LangChain, LlamaIndex)",
+                    body=f"""Built this tool to solve a problem I had: testing RAG quality before production.
+
+**What it does:**
+
+Tests your RAG system like pytest tests your code. You give it test cases (questions + expected answers), it runs them, gives you pass/fail with metrics.
+
+**Example:**
+
+```python
+from rag_guardian import Evaluator, TestCase
+
+tests = [
+    TestCase(
+        question="What's your return policy?",
+        expected_answer="30 days, no questions asked"
+    )
+]
+
+evaluator = Evaluator.from_config(".rag-guardian.yml")
+results = evaluator.evaluate_dataset(tests)
+
+if not results.passed:
+    print(f"Failed {{results.failed_tests}} tests")
+    exit(1)
+```
+
+**Integrations:**
+
+Works with LangChain and LlamaIndex out of the box. Custom RAG? Implement 2 methods (`retrieve` and `generate`).
+
+**Stats:**
+
+- {self.tests} tests passing
+- {self.coverage}% code coverage
+- Full CI/CD support
+- HTML + JSON reports
+
+**Links:**
+
+- Repo: {self.repo_url}
+- Install: `pip install rag-guardian`
+
+Open to feedback and PRs!
+""",
+                ),
+            ),
+            (
+                "r/LangChain",
+                RedditPost(
+                    title="Testing RAG quality with LangChain - automated framework",
+                    body=f"""If you're building RAG with LangChain and wondering how to test it before production, check this out.
+
+**Problem:** Manual testing is time-consuming and you still miss edge cases.
+
+**Solution:** Automated tests with metrics (faithfulness, groundedness, etc.)
+
+**Integration (3 lines):**
+
+```python
+from langchain.chains import RetrievalQA
+from rag_guardian.integrations import LangChainAdapter
+
+qa_chain = RetrievalQA.from_chain_type(...)  # Your existing chain
+
+adapter = LangChainAdapter(qa_chain)
+evaluator = Evaluator(adapter)
+results = evaluator.evaluate_dataset("tests.jsonl")
+```
+
+**What it tests:**
+
+- Faithfulness (hallucinations)
+- Groundedness (using context)
+- Context relevancy (retrieval quality)
+- Answer correctness (vs expected)
+
+**Output:** HTML report + JSON for CI/CD
+
+GitHub: {self.repo_url}
+PyPI: `pip install rag-guardian`
+
+{self.tests} tests, {self.coverage}% coverage, MIT license.
+
+Feedback welcome!
+""",
+                ),
+            ),
+        )
+
+        return posts
+
+    @_memoized
+    def generate_devto_article(self):
+        """Artykuł na Dev.to (długi format)."""
+        return DEVTO_TEMPLATE.format_map(self._params)
+
+    def generate_submission_list(self):
+        """Lista miejsc gdzie zgłosić projekt."""
+        return _SUBMISSIONS
 
     def save_all_content(self, output_dir: Path):
         """Zapisz wszystkie wygenerowane content do plików."""
+        # Importy tylko dla --platform all (szybszy start pozostałych komend)
+        import asyncio
+        from datetime import datetime
+
         output_dir.mkdir(exist_ok=True)
 
+        # Każdy plik składamy w pamięci ("".join) i zapisujemy jednym write_text
+        files = []
+
         # Twitter thread
         twitter = self.generate_twitter_thread()
-        with open(output_dir / "twitter_thread.txt", "w", encoding="utf-8") as f:
-            for i, tweet in enumerate(twitter, 1):
-                f.write(f"=== TWEET {i}/{len(twitter)} ===\n")
-                f.write(f"{tweet}\n\n")
-                f.write(f"Characters: {len(tweet)}\n")
-                f.write("="*60 + "\n\n")
+        total = len(twitter)
+        parts = [
+            f"=== TWEET {i}/{total} ===\n{tweet}\n\nCharacters: {len(tweet)}\n{_SEP60}\n\n"
+            for i, tweet in enumerate(twitter, 1)
+        ]
+        files.append(("twitter_thread.txt", "".join(parts)))
 
         # LinkedIn
-        linkedin = self.generate_linkedin_post()
-        with open(output_dir / "linkedin_post.md", "w", encoding="utf-8") as f:
-            f.write(linkedin)
+        files.append(("linkedin_post.md", self.generate_linkedin_post().encode("utf-8")))
 
         # Reddit
         reddit = self.generate_reddit_posts()
-        for subreddit, content in reddit.items():
-            filename = subreddit.replace("/", "_") + ".md"
-            with open(output_dir / filename, "w", encoding="utf-8") as f:
-                f.write(f"# {content['title']}\n\n")
-                f.write(content['body'])
+        for subreddit, post in reddit:
+            filename = subreddit.translate(_FILENAME_TABLE) + ".md"
+            files.append((filename, f"# {post.title}\n\n{post.body}"))
 
         # Dev.to
-        devto = self.generate_devto_article()
-        with open(output_dir / "devto_article.md", "w", encoding="utf-8") as f:
-            f.write(devto)
+        files.append(("devto_article.md", self.generate_devto_article().encode("utf-8")))
 
         # Submission list
         submissions = self.generate_submission_list()
-        with open(output_dir / "submission_list.json", "w", encoding="utf-8") as f:
-            json.dump(submissions, f, indent=2, ensure_ascii=False)
+        files.append(("submission_list.json", _submissions_json()))
 
         # Checklist markdown
-        with open(output_dir / "PROMOTION_CHECKLIST.md", "w", encoding="utf-8") as f:
-            f.write("# RAG Guardian - Promotion Checklist\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-
-            for category, items in submissions.items():
-                f.write(f"## {category}\n\n")
-                for item in items:
-                    f.write(f"- [ ] **{item['name']}** ({item['priority']})\n")
-                    f.write(f"  - URL: {item['url']}\n")
-                    f.write(f"  - Title: {item['title']}\n")
-                    f.write(f"  - Tips: {item['tips']}\n\n")
-
-        print(f"✅ Generated content saved to {output_dir}/")
-        print(f"\nFiles created:")
-        print(f"  - twitter_thread.txt")
-        print(f"  - linkedin_post.md")
-        print(f"  - r_MachineLearning.md")
-        print(f"  - r_Python.md")
-        print(f"  - r_LangChain.md")
-        print(f"  - devto_article.md")
-        print(f"  - submission_list.json")
-        print(f"  - PROMOTION_CHECKLIST.md")
-
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+        parts = [
+            "# RAG Guardian - Promotion Checklist\n\n",
+            f"Generated: {generated}\n\n",
+        ]
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="RAG Guardian Promotion Content Generator"
+        for category, items in submissions.items():
+            parts.append(f"## {category}\n\n")
+            for item in items:
+                parts.append(
+                    f"- [ ] **{item.name}** ({item.priority})\n"
+                    f"  - URL: {item.url}\n"
+                    f"  - Title: {item.title}\n"
+                    f"  - Tips: {item.tips}\n\n"
+                )
+        files.append(("PROMOTION_CHECKLIST.md", "".join(parts)))
+
+        asyncio.run(_write_files(output_dir, files))
+
+        print(f"✅ Generated content saved to {output_dir}/\n{_FILES_CREATED}")
+
+
+def _print_twitter(gen, args):
+    """Wypisz thread na Twitter/X z licznikiem znaków."""
+    tweets = gen.generate_twitter_thread()
+    total = len(tweets)
+    sys.stdout.write(
+        "".join(
+            f"\n=== TWEET {i}/{total} ===\n{tweet}\nCharacters: {len(tweet)}\n"
+            for i, tweet in enumerate(tweets, 1)
+        )
     )
-    parser.add_argument(
-        "--platform",
-        choices=["twitter", "linkedin", "reddit", "devto", "all"],
-        help="Generate content for specific platform"
+
+
+def _print_reddit(gen, args):
+    """Wypisz posty na wszystkie subreddity."""
+    sys.stdout.write(
+        "".join(
+            f"\n{_SEP70}\n{sub}\n{_SEP70}\n\nTitle: {post.title}\n\n{post.body}\n"
+            for sub, post in gen.generate_reddit_posts()
+        )
     )
+
+
+# --platform -> funkcja(gen, args); kolejność = kolejność choices w --help
+_PLATFORMS = {
+    "twitter": _print_twitter,
+    "linkedin": lambda gen, args: print(gen.generate_linkedin_post()),
+    "reddit": _print_reddit,
+    "devto": lambda gen, args: print(gen.generate_devto_article()),
+    "all": lambda gen, args: gen.save_all_content(args.output_dir),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RAG Guardian Promotion Content Generator")
     parser.add_argument(
-        "--submit",
-        action="store_true",
-        help="Show submission checklist"
+        "--platform", choices=list(_PLATFORMS), help="Generate content for specific platform"
     )
+    parser.add_argument("--submit", action="store_true", help="Show submission checklist")
     parser.add_argument(
         "--output-dir",
         type=Path,
         default=Path("promotion_content"),
-        help="Output directory for generated content"
+        help="Output directory for generated content",
     )
 
     args = parser.parse_args()
@@ -825,44 +978,26 @@ def main():
 
     if args.submit:
         submissions = gen.generate_submission_list()
-        print("\n" + "="*70)
-        print("RAG GUARDIAN - SUBMISSION CHECKLIST")
-        print("="*70 + "\n")
+        parts = [f"\n{_SEP70}\nRAG GUARDIAN - SUBMISSION CHECKLIST\n{_SEP70}\n\n"]
 
         for category, items in submissions.items():
-            print(f"\n### {category}")
-            print("-" * 70)
+            parts.append(f"\n### {category}\n{_DASH70}\n")
             for item in items:
-                print(f"\n{item['priority']} {item['name']}")
-                print(f"    URL: {item['url']}")
-                print(f"    Title: {item['title']}")
-                print(f"    Tips: {item['tips']}")
-
-        print("\n" + "="*70)
-        print("Run with --platform all to generate content for all platforms")
-        print("="*70 + "\n")
+                parts.append(
+                    f"\n{item.priority} {item.name}\n"
+                    f"    URL: {item.url}\n"
+                    f"    Title: {item.title}\n"
+                    f"    Tips: {item.tips}\n"
+                )
+
+        parts.append(
+            f"\n{_SEP70}\nRun with --platform all to generate content for all platforms\n"
+            f"{_SEP70}\n\n"
+        )
+        sys.stdout.write("".join(parts))
 
     elif args.platform:
-        if args.platform == "all":
-            gen.save_all_content(args.output_dir)
-        elif args.platform == "twitter":
-            tweets = gen.generate_twitter_thread()
-            for i, tweet in enumerate(tweets, 1):
-                print(f"\n=== TWEET {i}/{len(tweets)} ===")
-                print(tweet)
-                print(f"Characters: {len(tweet)}")
-        elif args.platform == "linkedin":
-            print(gen.generate_linkedin_post())
-        elif args.platform == "reddit":
-            posts = gen.generate_reddit_posts()
-            for sub, content in posts.items():
-                print(f"\n{'='*70}")
-                print(f"{sub}")
-                print('='*70)
-                print(f"\nTitle: {content['title']}\n")
-                print(content['body'])
-        elif args.platform == "devto":
-            print(gen.generate_devto_article())
+        _PLATFORMS[args.platform](gen, args)
     else:
         parser.print_help()
 
@@ -0,0 +1,104 @@
+"""Shared fixtures for integration tests."""
+
+import re
+
+import pytest
+
+from rag_guardian.core.config import Config
+from rag_guardian.core.pipeline import Evaluator
+from rag_guardian.integrations.base import BaseRAGAdapter
+
+
+class MockRAG(BaseRAGAdapter, cache=128):
+    """Mock RAG system for testing."""
+
+    def retrieve(self, query: str) -> list[str]:
+        """Return mock contexts."""
+        return [
+            f"Context about {query}",
+            "Additional relevant information",
+        ]
+
+    def generate(self, query: str, contexts: list[str]) -> str:
+        """Return mock answer."""
+        return f"Answer based on {len(contexts)} contexts: {query}"
+
+
+class SimpleRAG(BaseRAGAdapter):
+    """Simple RAG for testing."""
+
+    def __init__(self):
+        self.knowledge = {
+            "rag": "RAG is Retrieval-Augmented Generation",
+            "llm": "LLM stands for Large Language Model",
+            "embedding": "Embeddings are vector representations of text",
+        }
+
+    def retrieve(self, query: str) -> list[str]:
+        # Look up each distinct query word instead of scanning every knowledge key
+        words = dict.fromkeys(re.findall(r"\w+", query.lower()))
+        contexts = [self.knowledge[word] for word in words if word in self.knowledge]
+
+        return contexts or ["No relevant context found"]
+
+    def generate(self, query: str, contexts: list[str]) -> str:
+        if contexts and contexts[0] != "No relevant context found":
+            return contexts[0]
+        return "I don't have information about that"
+
+
+@pytest.fixture(scope="session")
+def mock_rag():
+    """Create mock RAG adapter."""
+    return MockRAG()
+
+
+@pytest.fixture(scope="session")
+def simple_rag():
+    """Create keyword-lookup RAG adapter."""
+    return SimpleRAG()
+
+
+@pytest.fixture(scope="session")
+def jsonl_two_cases(tmp_path_factory):
+    """Create two-case JSONL dataset (read-only, written once per session)."""
+    dataset_path = tmp_path_factory.mktemp("datasets") / "two_cases.jsonl"
+    dataset_path.write_text(
+        '{"question": "What is RAG?", "expected_answer": "Retrieval-Augmented Generation"}\n'
+        '{"question": "What is an LLM?", "expected_answer": "Large Language Model"}\n',
+        encoding="utf-8",
+    )
+    return str(dataset_path)
+
+
+@pytest.fixture(scope="session")
+def jsonl_empty(tmp_path_factory):
+    """Create empty JSONL dataset."""
+    dataset_path = tmp_path_factory.mktemp("datasets") / "empty.jsonl"
+    dataset_path.write_text("", encoding="utf-8")
+    return str(dataset_path)
+
+
+@pytest.fixture(scope="session")
+def jsonl_invalid(tmp_path_factory):
+    """Create JSONL dataset with a line that is not valid JSON."""
+    dataset_path = tmp_path_factory.mktemp("datasets") / "invalid.jsonl"
+    dataset_path.write_text("not valid json\n", encoding="utf-8")
+    return str(dataset_path)
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Get a default config shared read-only by the tests of one module."""
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def default_evaluator(rag_adapter, default_config):
+    """
+    Create evaluator with default config shared by tests in a module.
+
+    Each test module picks its adapter with a module-scoped ``rag_adapter`` fixture.
+    Tests that change thresholds must build their own Config and Evaluator.
+    """
+    return Evaluator(rag_adapter, default_config)
@@ -1,62 +1,29 @@
 """End-to-end integration tests for RAG Guardian."""
 
-import tempfile
-from pathlib import Path
+from collections import Counter
 
 import pytest
 
+from rag_guardian.core import pipeline
 from rag_guardian.core.config import Config
 from rag_guardian.core.pipeline import Evaluator
 from rag_guardian.core.types import TestCase
-from rag_guardian.integrations.base import BaseRAGAdapter
-from rag_guardian.reporting.json import JSONReporter
+from rag_guardian.reporting.json import CompactJSONReporter, JSONReporter
 
 
-class MockRAG(BaseRAGAdapter):
-    """Mock RAG system for testing."""
-
-    def retrieve(self, query: str) -> list[str]:
-        """Return mock contexts."""
-        return [
-            f"Context about {query}",
-            "Additional relevant information",
-        ]
-
-    def generate(self, query: str, contexts: list[str]) -> str:
-        """Return mock answer."""
-        return f"Answer based on {len(contexts)} contexts: {query}"
-
-
-@pytest.fixture
-def mock_rag():
-    """Create mock RAG adapter."""
-    return MockRAG()
-
-
-@pytest.fixture
-def test_dataset():
-    """Create temporary test dataset."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-        f.write(
-            '{"question": "What is RAG?", "expected_answer": "Retrieval-Augmented Generation"}\n'
-        )
-        f.write(
-            '{"question": "How does it work?", "expected_answer": "Combines retrieval and generation"}\n'
-        )
-        return f.name
+@pytest.fixture(scope="module")
+def rag_adapter(mock_rag):
+    """RAG adapter used by the shared default_evaluator fixture."""
+    return mock_rag
 
 
 class TestEndToEnd:
     """End-to-end integration tests."""
 
-    def test_basic_evaluation(self, mock_rag, test_dataset):
+    def test_basic_evaluation(self, default_evaluator, jsonl_two_cases):
         """Test basic evaluation flow."""
-        # Create evaluator with default config
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
-
-        # Run evaluation
-        result = evaluator.evaluate_dataset(test_dataset)
+        # Run evaluation with default config
+        result = default_evaluator.evaluate_dataset(jsonl_two_cases)
 
         # Verify result structure
         assert result is not None
@@ -70,49 +37,50 @@ class TestEndToEnd:
             assert "context_relevancy" in test_result.metric_scores
             assert "answer_correctness" in test_result.metric_scores
 
-    def test_single_test_case(self, mock_rag):
+    def test_single_test_case(self, default_evaluator):
         """Test evaluation of single test case."""
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
-
         test_case = TestCase(
             question="What is RAG?",
             expected_answer="Retrieval-Augmented Generation",
         )
 
-        result = evaluator.evaluate_test_case(test_case)
+        result = default_evaluator.evaluate_test_case(test_case)
 
         assert result.rag_output.answer is not None
         assert len(result.rag_output.contexts) > 0
         assert len(result.metric_scores) > 0
 
-    def test_json_reporting(self, mock_rag, test_dataset):
+    def test_json_reporting(self, default_evaluator, jsonl_two_cases, tmp_path):
         """Test JSON report generation."""
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
+        result = default_evaluator.evaluate_dataset(jsonl_two_cases)
 
-        result = evaluator.evaluate_dataset(test_dataset)
+        output_path = tmp_path / "results.json"
+        JSONReporter.save(result, str(output_path))
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            output_path = f.name
+        # Verify file was created
+        assert output_path.exists()
 
-        try:
-            JSONReporter.save(result, output_path)
+        # Load and verify content
+        loaded = JSONReporter.load(str(output_path))
+        assert "summary" in loaded
+        assert "test_results" in loaded
+        assert loaded["total_tests"] == 2
 
-            # Verify file was created
-            assert Path(output_path).exists()
+    def test_compact_json_reporting(self, default_evaluator, jsonl_two_cases, tmp_path):
+        """Test compact JSON report is written without indentation."""
+        result = default_evaluator.evaluate_dataset(jsonl_two_cases)
 
-            # Load and verify content
-            loaded = JSONReporter.load(output_path)
-            assert "summary" in loaded
-            assert "test_results" in loaded
-            assert loaded["total_tests"] == 2
+        output_path = tmp_path / "results.json"
+        CompactJSONReporter.save(result, str(output_path))
 
-        finally:
-            Path(output_path).unlink()
+        content = output_path.read_text(encoding="utf-8")
+        assert "\n" not in content
 
-    def test_metric_thresholds(self, mock_rag, test_dataset):
+        loaded = JSONReporter.load(str(output_path))
+        assert loaded["passed"] == result.passed
+        assert "timestamp" in loaded
+
+    def test_metric_thresholds(self, mock_rag, jsonl_two_cases):
         """Test that metric thresholds are respected."""
         # Create config with very high thresholds
         config = Config()
@@ -120,25 +88,22 @@ class TestEndToEnd:
         config.metrics.faithfulness.required = True
 
         evaluator = Evaluator(mock_rag, config)
-        result = evaluator.evaluate_dataset(test_dataset)
+        result = evaluator.evaluate_dataset(jsonl_two_cases)
 
         # With high thresholds, some tests should fail
         # (mock RAG won't produce perfect scores)
         # This tests that threshold checking works
         assert result is not None
 
-    def test_custom_metadata(self, mock_rag):
+    def test_custom_metadata(self, default_evaluator):
         """Test test cases with custom metadata."""
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
-
         test_case = TestCase(
             question="Custom question",
             expected_answer="Custom answer",
             metadata={"category": "test", "priority": "high"},
         )
 
-        result = evaluator.evaluate_test_case(test_case)
+        result = default_evaluator.evaluate_test_case(test_case)
         assert result.test_case.metadata["category"] == "test"
         assert result.test_case.metadata["priority"] == "high"
 
@@ -146,25 +111,20 @@ class TestEndToEnd:
 class TestPipelineComponents:
     """Test individual pipeline components."""
 
-    def test_load_test_cases(self, test_dataset):
+    def test_load_test_cases(self, mock_rag, default_config, jsonl_two_cases):
         """Test loading test cases from JSONL."""
         from rag_guardian.core.pipeline import EvaluationPipeline
 
-        mock_rag = MockRAG()
-        config = Config()
-        pipeline = EvaluationPipeline(mock_rag, config)
+        pipeline = EvaluationPipeline(mock_rag, default_config)
 
-        test_cases = pipeline.load_test_cases(test_dataset)
+        test_cases = pipeline.load_test_cases(jsonl_two_cases)
 
         assert len(test_cases) == 2
         assert all(isinstance(tc, TestCase) for tc in test_cases)
 
-    def test_pipeline_summary(self, mock_rag, test_dataset):
+    def test_pipeline_summary(self, default_evaluator, jsonl_two_cases):
         """Test summary calculation."""
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
-
-        result = evaluator.evaluate_dataset(test_dataset)
+        result = default_evaluator.evaluate_dataset(jsonl_two_cases)
 
         # Verify summary metrics
         assert "pass_rate" in result.summary
@@ -175,47 +135,62 @@ class TestPipelineComponents:
         assert 0 <= result.summary["pass_rate"] <= 1
         assert result.summary["total_tests"] == 2
 
+    def test_metrics_built_once_per_evaluator(
+        self, mock_rag, default_config, jsonl_two_cases, monkeypatch
+    ):
+        """Test metric objects are built once per evaluator and not per test case."""
+        constructed = Counter()
+
+        def counting(metric_cls):
+            class CountingMetric(metric_cls):
+                def __init__(self, *args, **kwargs):
+                    constructed[metric_cls.name] += 1
+                    super().__init__(*args, **kwargs)
+
+            return CountingMetric
+
+        monkeypatch.setattr(
+            pipeline,
+            "METRIC_CLASSES",
+            {name: counting(cls) for name, cls in pipeline.METRIC_CLASSES.items()},
+        )
+
+        evaluator = Evaluator(mock_rag, default_config)
+        evaluator.evaluate_dataset(jsonl_two_cases)
+        evaluator.evaluate_dataset(jsonl_two_cases)
+
+        assert constructed == dict.fromkeys(pipeline.METRIC_CLASSES, 1)
+
 
 class TestErrorHandling:
     """Test error handling."""
 
-    def test_missing_dataset(self, mock_rag):
+    def test_missing_dataset(self, default_evaluator):
         """Test error when dataset file doesn't exist."""
-        config = Config()
-        evaluator = Evaluator(mock_rag, config)
-
         with pytest.raises(FileNotFoundError):
-            evaluator.evaluate_dataset("/nonexistent/path.jsonl")
+            default_evaluator.evaluate_dataset("/nonexistent/path.jsonl")
 
-    def test_empty_dataset(self, mock_rag):
+    def test_empty_dataset(self, default_evaluator, jsonl_empty):
         """Test error on empty dataset."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            dataset_path = f.name
-            # Write empty file
-
-        try:
-            config = Config()
-            evaluator = Evaluator(mock_rag, config)
-
-            with pytest.raises(ValueError, match="No test cases found"):
-                evaluator.evaluate_dataset(dataset_path)
-        finally:
-            Path(dataset_path).unlink()
+        with pytest.raises(ValueError, match="No test cases found"):
+            default_evaluator.evaluate_dataset(jsonl_empty)
 
-    def test_invalid_jsonl(self, mock_rag):
+    def test_invalid_jsonl(self, default_evaluator, jsonl_invalid):
         """Test error on invalid JSONL format."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write("not valid json\n")
-            dataset_path = f.name
-
-        try:
-            config = Config()
-            evaluator = Evaluator(mock_rag, config)
-
-            with pytest.raises(ValueError, match="Invalid test case"):
-                evaluator.evaluate_dataset(dataset_path)
-        finally:
-            Path(dataset_path).unlink()
+        with pytest.raises(ValueError, match="Invalid test case"):
+            default_evaluator.evaluate_dataset(jsonl_invalid)
+
+    def test_malformed_line_fails_before_rag_calls(self, mock_rag, tmp_path, monkeypatch):
+        """Test a malformed line further down the file stops evaluation before it starts."""
+        dataset_path = tmp_path / "late_error.jsonl"
+        dataset_path.write_text('{"question": "Q1"}\nnot valid json\n', encoding="utf-8")
+        evaluator = Evaluator(mock_rag, Config())
+        calls = []
+        monkeypatch.setattr(evaluator.pipeline, "evaluate_test_case", calls.append)
+
+        with pytest.raises(ValueError, match="Invalid test case"):
+            evaluator.evaluate_dataset(str(dataset_path))
+        assert calls == []
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 """Integration tests for complete workflows."""
 
-import tempfile
-from pathlib import Path
+import pytest
 
+from rag_guardian.core import pipeline
 from rag_guardian.core.config import Config
 from rag_guardian.core.loader import DataLoader
 from rag_guardian.core.pipeline import Evaluator
@@ -10,118 +10,61 @@ from rag_guardian.core.types import TestCase
 from rag_guardian.integrations.base import BaseRAGAdapter
 from rag_guardian.reporting.html import HTMLReporter
 from rag_guardian.reporting.json import JSONReporter
+from rag_guardian.utils import logging as logging_utils
 
 
-class SimpleRAG(BaseRAGAdapter):
-    """Simple RAG for testing."""
-
-    def __init__(self):
-        self.knowledge = {
-            "rag": "RAG is Retrieval-Augmented Generation",
-            "llm": "LLM stands for Large Language Model",
-            "embedding": "Embeddings are vector representations of text",
-        }
-
-    def retrieve(self, query: str) -> list[str]:
-        query_lower = query.lower()
-        contexts = []
-
-        for key, value in self.knowledge.items():
-            if key in query_lower:
-                contexts.append(value)
-
-        return contexts or ["No relevant context found"]
-
-    def generate(self, query: str, contexts: list[str]) -> str:
-        if contexts and contexts[0] != "No relevant context found":
-            return contexts[0]
-        return "I don't have information about that"
+@pytest.fixture(scope="module")
+def rag_adapter(simple_rag):
+    """RAG adapter used by the shared default_evaluator fixture."""
+    return simple_rag
 
 
 class TestCompleteWorkflow:
     """Test complete end-to-end workflows."""
 
-    def test_jsonl_to_html_report_workflow(self):
+    def test_jsonl_to_html_report_workflow(self, default_evaluator, jsonl_two_cases, tmp_path):
         """Test complete workflow: JSONL → Evaluation → HTML Report."""
-        # 1. Create test cases JSONL file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write(
-                '{"question": "What is RAG?", "expected_answer": "Retrieval-Augmented Generation"}\n'
-            )
-            f.write('{"question": "What is an LLM?", "expected_answer": "Large Language Model"}\n')
-            dataset_path = f.name
-
-        # 2. Create RAG adapter
-        rag = SimpleRAG()
-
-        # 3. Create config
-        config = Config()
-
-        # 4. Create evaluator
-        evaluator = Evaluator(rag, config)
-
-        # 5. Load test cases
-        test_cases = DataLoader.load_jsonl(dataset_path)
+        # 1. Load test cases from the shared JSONL file
+        test_cases = DataLoader.load_jsonl(jsonl_two_cases)
         assert len(test_cases) == 2
 
-        # 6. Run evaluation
-        results = evaluator.evaluate_dataset(test_cases)
+        # 2. Run evaluation (default config and SimpleRAG adapter)
+        results = default_evaluator.evaluate_dataset(test_cases)
 
-        # 7. Verify results
+        # 3. Verify results
         assert results.total_tests == 2
         assert len(results.test_case_results) == 2
 
-        # 8. Generate HTML report
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            html_path = f.name
-
-        HTMLReporter.generate(results, html_path, "Test Workflow Report")
+        # 4. Generate HTML report
+        html_path = tmp_path / "report.html"
+        HTMLReporter.generate(results, str(html_path), "Test Workflow Report")
 
-        # 9. Verify HTML was created
-        assert Path(html_path).exists()
+        # 5. Verify HTML was created
+        assert html_path.exists()
 
-        with open(html_path) as f:
-            html = f.read()
-            assert "Test Workflow Report" in html
-            assert len(html) > 1000  # Should be substantial
+        html = html_path.read_text(encoding="utf-8")
+        assert "Test Workflow Report" in html
+        assert len(html) > 1000  # Should be substantial
 
-        # Cleanup
-        Path(dataset_path).unlink()
-        Path(html_path).unlink()
-
-    def test_jsonl_to_json_report_workflow(self):
+    def test_jsonl_to_json_report_workflow(self, default_evaluator, jsonl_two_cases, tmp_path):
         """Test workflow with JSON reporting."""
-        # Create JSONL
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write('{"question": "Q1", "expected_answer": "A1"}\n')
-            dataset_path = f.name
-
         # Run evaluation
-        rag = SimpleRAG()
-        config = Config()
-        evaluator = Evaluator(rag, config)
-        test_cases = DataLoader.load_jsonl(dataset_path)
-        results = evaluator.evaluate_dataset(test_cases)
+        test_cases = DataLoader.load_jsonl(jsonl_two_cases)
+        results = default_evaluator.evaluate_dataset(test_cases)
 
         # Generate JSON report
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json_path = f.name
-
-        JSONReporter.save(results, json_path)
+        json_path = tmp_path / "results.json"
+        JSONReporter.save(results, str(json_path))
 
         # Verify JSON
-        assert Path(json_path).exists()
+        assert json_path.exists()
 
-        loaded = JSONReporter.load(json_path)
+        loaded = JSONReporter.load(str(json_path))
         assert "summary" in loaded
         assert "test_results" in loaded
-        assert loaded["total_tests"] == 1
+        assert loaded["total_tests"] == 2
 
-        # Cleanup
-        Path(dataset_path).unlink()
-        Path(json_path).unlink()
-
-    def test_multiple_format_reporting(self):
+    def test_multiple_format_reporting(self, default_evaluator, tmp_path, monkeypatch):
         """Test generating multiple report formats from same results."""
         # Create test cases
         test_cases = [
@@ -130,27 +73,31 @@ class TestCompleteWorkflow:
         ]
 
         # Run evaluation
-        rag = SimpleRAG()
-        evaluator = Evaluator(rag)
-        results = evaluator.evaluate_dataset(test_cases)
+        results = default_evaluator.evaluate_dataset(test_cases)
 
         # Generate both JSON and HTML
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_path = Path(tmpdir) / "results.json"
-            html_path = Path(tmpdir) / "results.html"
-
-            JSONReporter.save(results, str(json_path))
-            HTMLReporter.generate(results, str(html_path))
-
-            # Verify both exist
-            assert json_path.exists()
-            assert html_path.exists()
-
-            # Verify content
-            assert json_path.stat().st_size > 100
-            assert html_path.stat().st_size > 1000
-
-    def test_config_driven_workflow(self):
+        json_path = tmp_path / "results.json"
+        html_path = tmp_path / "results.html"
+
+        JSONReporter.save(results, str(json_path))
+        # Only the file is checked below; skip rendering the per-test sections
+        iter_html = HTMLReporter._iter_html
+        monkeypatch.setattr(
+            HTMLReporter,
+            "_iter_html",
+            lambda result, title: iter_html(result, title, minimal=True),
+        )
+        HTMLReporter.generate(results, str(html_path))
+
+        # Verify both exist
+        assert json_path.exists()
+        assert html_path.exists()
+
+        # Verify content
+        assert json_path.stat().st_size > 100
+        assert html_path.stat().st_size > 1000
+
+    def test_config_driven_workflow(self, rag_adapter, tmp_path):
         """Test workflow using YAML config."""
         # Create config file
         config_content = """
@@ -173,19 +120,17 @@ reporting:
   output_dir: "results"
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(config_content, encoding="utf-8")
 
         # Load config
-        config = Config.from_yaml(config_path)
+        config = Config.from_yaml(str(config_path))
 
         assert config.metrics.faithfulness.threshold == 0.90
         assert config.metrics.groundedness.threshold == 0.85
 
         # Use config in evaluation
-        rag = SimpleRAG()
-        evaluator = Evaluator(rag, config)
+        evaluator = Evaluator(rag_adapter, config)
 
         test_cases = [TestCase(question="What is RAG?", expected_answer="RAG")]
         results = evaluator.evaluate_dataset(test_cases)
@@ -195,9 +140,7 @@ reporting:
             faith_score = test_result.metric_scores["faithfulness"]
             assert faith_score.threshold == 0.90
 
-        Path(config_path).unlink()
-
-    def test_save_and_load_test_cases(self):
+    def test_save_and_load_test_cases(self, tmp_path):
         """Test saving and loading test cases roundtrip."""
         original_cases = [
             TestCase(
@@ -212,8 +155,7 @@ reporting:
             ),
         ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            save_path = f.name
+        save_path = str(tmp_path / "cases.jsonl")
 
         # Save
         DataLoader.save_jsonl(original_cases, save_path)
@@ -227,9 +169,7 @@ reporting:
         assert loaded_cases[0].metadata["category"] == "basic"
         assert loaded_cases[1].acceptable_answers == ["A2", "Answer 2"]
 
-        Path(save_path).unlink()
-
-    def test_evaluation_with_custom_metrics_config(self):
+    def test_evaluation_with_custom_metrics_config(self, rag_adapter):
         """Test evaluation with custom metric configuration."""
         # Create config with specific thresholds
         config = Config()
@@ -238,8 +178,7 @@ reporting:
         config.metrics.context_relevancy.enabled = False
 
         # Run evaluation
-        rag = SimpleRAG()
-        evaluator = Evaluator(rag, config)
+        evaluator = Evaluator(rag_adapter, config)
 
         test_cases = [TestCase(question="What is RAG?", expected_answer="RAG")]
         results = evaluator.evaluate_dataset(test_cases)
@@ -280,17 +219,30 @@ reporting:
             # Expected for now - error handling not fully implemented yet
             pass
 
-    def test_evaluation_with_no_expected_answers(self):
+    @pytest.mark.parametrize("sync_output", [True, False], ids=["sync", "listener"])
+    def test_errors_logged_before_evaluation_returns(self, capsys, monkeypatch, sync_output):
+        """Test ERROR records are written before evaluate_dataset returns."""
+        monkeypatch.setattr(logging_utils, "_sync_output", sync_output)
+
+        class FailingRAG(BaseRAGAdapter):
+            def retrieve(self, query: str):
+                raise Exception("Retrieval failed!")
+
+            def generate(self, query: str, contexts: list[str]):
+                return "answer"
+
+        Evaluator(FailingRAG()).evaluate_dataset([TestCase(question="Q1")])
+
+        assert "ERROR - Error evaluating test case: Retrieval failed!" in capsys.readouterr().out
+
+    def test_evaluation_with_no_expected_answers(self, default_evaluator):
         """Test evaluation when test cases have no expected answers."""
         test_cases = [
             TestCase(question="Q1"),  # No expected answer
             TestCase(question="Q2"),  # No expected answer
         ]
 
-        rag = SimpleRAG()
-        evaluator = Evaluator(rag)
-
-        results = evaluator.evaluate_dataset(test_cases)
+        results = default_evaluator.evaluate_dataset(test_cases)
 
         # Should still run
         assert results.total_tests == 2
@@ -298,7 +250,7 @@ reporting:
         # Answer correctness might score differently without expected answer
         # but other metrics should still work
 
-    def test_results_summary_calculation(self):
+    def test_results_summary_calculation(self, default_evaluator):
         """Test that summary statistics are calculated correctly."""
         test_cases = [
             TestCase(question="What is RAG?", expected_answer="RAG"),
@@ -306,9 +258,7 @@ reporting:
             TestCase(question="What is embedding?", expected_answer="Embedding"),
         ]
 
-        rag = SimpleRAG()
-        evaluator = Evaluator(rag)
-        results = evaluator.evaluate_dataset(test_cases)
+        results = default_evaluator.evaluate_dataset(test_cases)
 
         # Verify summary
         assert "avg_faithfulness" in results.summary
@@ -319,7 +269,48 @@ reporting:
         assert results.summary["total_tests"] == 3
         assert 0 <= results.summary["pass_rate"] <= 1
 
-    def test_full_workflow_with_failures(self):
+    def test_streamed_jsonl_workflow(self, default_evaluator, jsonl_two_cases):
+        """Test evaluating test cases streamed from DataLoader.iter_jsonl."""
+        results = default_evaluator.evaluate_dataset(DataLoader.iter_jsonl(jsonl_two_cases))
+
+        assert results.total_tests == 2
+        assert results.test_case_results[0].test_case.question == "What is RAG?"
+
+    def test_concurrent_evaluation_matches_sequential(self, rag_adapter, default_evaluator):
+        """Test evaluation in a thread pool keeps results in dataset order."""
+        test_cases = [
+            TestCase(question="What is RAG?", expected_answer="RAG"),
+            TestCase(question="What is an LLM?", expected_answer="LLM"),
+            TestCase(question="What is embedding?", expected_answer="Embedding"),
+        ]
+
+        config = Config(concurrency=4)
+        evaluator = Evaluator(rag_adapter, config)
+        results = evaluator.evaluate_dataset(test_cases)
+        expected = default_evaluator.evaluate_dataset(test_cases)
+
+        assert [r.test_case.question for r in results.test_case_results] == [
+            tc.question for tc in test_cases
+        ]
+        assert results.summary == expected.summary
+
+    def test_concurrency_capped_at_test_case_count(self, rag_adapter, monkeypatch):
+        """Test the thread pool never starts more workers than there are test cases."""
+        pool_sizes = []
+        real_executor = pipeline.ThreadPoolExecutor
+
+        def recording_executor(max_workers):
+            pool_sizes.append(max_workers)
+            return real_executor(max_workers=max_workers)
+
+        monkeypatch.setattr(pipeline, "ThreadPoolExecutor", recording_executor)
+        test_cases = [TestCase(question="What is RAG?"), TestCase(question="What is an LLM?")]
+
+        Evaluator(rag_adapter, Config(concurrency=64)).evaluate_dataset(test_cases)
+
+        assert pool_sizes == [2]
+
+    def test_full_workflow_with_failures(self, rag_adapter, tmp_path):
         """Test workflow where some tests fail."""
         test_cases = [
             TestCase(question="What is RAG?", expected_answer="Completely wrong answer"),
@@ -327,12 +318,11 @@ reporting:
         ]
 
         # Run evaluation
-        rag = SimpleRAG()
         config = Config()
         config.metrics.answer_correctness.threshold = 0.95  # High threshold
         config.metrics.answer_correctness.required = True
 
-        evaluator = Evaluator(rag, config)
+        evaluator = Evaluator(rag_adapter, config)
         results = evaluator.evaluate_dataset(test_cases)
 
         # Should have some failures
@@ -340,11 +330,9 @@ reporting:
         assert not results.passed
 
         # Generate reports showing failures
-        with tempfile.TemporaryDirectory() as tmpdir:
-            html_path = Path(tmpdir) / "failures.html"
-            HTMLReporter.generate(results, str(html_path))
-
-            with open(html_path) as f:
-                html = f.read()
-                # Should show failure info
-                assert "FAILED" in html or "fail" in html.lower()
+        html_path = tmp_path / "failures.html"
+        HTMLReporter.generate(results, str(html_path))
+
+        html = html_path.read_text(encoding="utf-8")
+        # Should show failure info
+        assert "FAILED" in html or "fail" in html.lower()
@@ -0,0 +1,34 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from rag_guardian.core.loader import DataLoader
+
+
+@pytest.fixture(scope="session")
+def all_cases(tmp_path_factory):
+    """
+    Load one JSONL dataset covering every happy-path variant, once per session.
+
+    Lines are: Q1, Q2 with metadata, a blank line, and a test case setting every
+    optional field. The returned list is shared, so tests must not mutate it.
+    """
+    dataset_path = tmp_path_factory.mktemp("loader") / "all_cases.jsonl"
+    dataset_path.write_text(
+        '{"question": "Q1", "expected_answer": "A1"}\n'
+        '{"question": "Q2", "expected_answer": "A2", "metadata": {"cat": "test"}}\n'
+        "\n"
+        '{"question": "Q", "expected_answer": "A", "expected_contexts": ["C1"], '
+        '"acceptable_answers": ["A1", "A2"], "required_contexts": ["R1"], '
+        '"forbidden_contexts": ["F1"], "metadata": {"key": "value"}}\n',
+        encoding="utf-8",
+    )
+    return DataLoader.load_jsonl(str(dataset_path))
+
+
+@pytest.fixture(scope="session")
+def invalid_jsonl_path(tmp_path_factory):
+    """Create JSONL dataset whose second line is not valid JSON."""
+    dataset_path = tmp_path_factory.mktemp("loader") / "invalid.jsonl"
+    dataset_path.write_text('{"question": "Q1"}\nnot valid json\n', encoding="utf-8")
+    return dataset_path
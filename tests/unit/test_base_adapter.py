@@ -0,0 +1,94 @@
+"""Unit tests for the base RAG adapter."""
+
+import gc
+import weakref
+
+from rag_guardian.integrations.base import BaseRAGAdapter
+
+
+class CountingRAG(BaseRAGAdapter):
+    """Adapter that counts retrieve calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def retrieve(self, query: str) -> list[str]:
+        self.calls += 1
+        return [f"Context about {query}"]
+
+    def generate(self, query: str, contexts: list[str]) -> str:
+        return f"Answer to {query}"
+
+
+class CachedRAG(CountingRAG, cache=8):
+    """Counting adapter with retrieve caching enabled."""
+
+    def retrieve(self, query: str) -> list[str]:
+        return super().retrieve(query)
+
+
+class RecachedRAG(CachedRAG, cache=4):
+    """Subclass of a cached adapter that asks for caching again."""
+
+
+class TestRetrieveCache:
+    """Tests for opt-in retrieve caching."""
+
+    def test_uncached_by_default(self):
+        """Test adapters call retrieve every time unless they opt in."""
+        rag = CountingRAG()
+
+        rag.execute("What is RAG?")
+        rag.execute("What is RAG?")
+
+        assert rag.calls == 2
+
+    def test_repeated_query_hits_cache(self):
+        """Test a repeated query string is served from the cache."""
+        rag = CachedRAG()
+
+        first = rag.execute("What is RAG?")
+        second = rag.execute("What is RAG?")
+        rag.execute("How does it work?")
+
+        assert rag.calls == 2
+        assert first.contexts == second.contexts
+
+    def test_cached_contexts_are_copies(self):
+        """Test mutating returned contexts does not change the cached value."""
+        rag = CachedRAG()
+
+        rag.retrieve("What is RAG?").append("extra")
+
+        assert rag.retrieve("What is RAG?") == ["Context about What is RAG?"]
+
+    def test_cache_is_per_instance(self):
+        """Test two adapters do not share cached results."""
+        first, second = CachedRAG(), CachedRAG()
+
+        first.retrieve("What is RAG?")
+        second.retrieve("What is RAG?")
+
+        assert first.calls == 1
+        assert second.calls == 1
+
+    def test_adapter_freed_with_its_cache(self):
+        """Test the cache does not keep a discarded adapter alive."""
+        rag = CachedRAG()
+        rag.retrieve("What is RAG?")
+        ref = weakref.ref(rag)
+
+        del rag
+        gc.collect()
+
+        assert ref() is None
+
+    def test_inherited_cache_not_wrapped_twice(self):
+        """Test passing cache again to a subclass keeps the inherited wrapper."""
+        rag = RecachedRAG()
+
+        rag.retrieve("What is RAG?")
+        rag.retrieve("What is RAG?")
+
+        assert RecachedRAG.retrieve is CachedRAG.retrieve
+        assert rag.calls == 1
@@ -1,11 +1,9 @@
 """Unit tests for configuration."""
 
-import os
-import tempfile
-
 import pytest
 
 from rag_guardian.core.config import Config
+from rag_guardian.exceptions import ConfigurationError
 
 
 class TestConfig:
@@ -35,7 +33,7 @@ class TestConfig:
         assert config.metrics.faithfulness.threshold == 0.85
         assert config.metrics.faithfulness.required
 
-    def test_from_yaml(self):
+    def test_from_yaml(self, tmp_path):
         """Test loading from YAML file."""
         yaml_content = """
 version: "1.0"
@@ -55,24 +53,19 @@ metrics:
     threshold: 0.80
 """
 
-        # Create temporary YAML file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            config = Config.from_yaml(temp_path)
+        config = Config.from_yaml(str(config_path))
 
-            assert config.rag_system.type == "langchain"
-            assert config.metrics.faithfulness.threshold == 0.85
-            assert config.metrics.groundedness.threshold == 0.80
-        finally:
-            os.unlink(temp_path)
+        assert config.rag_system.type == "langchain"
+        assert config.metrics.faithfulness.threshold == 0.85
+        assert config.metrics.groundedness.threshold == 0.80
 
-    def test_env_var_substitution(self):
+    def test_env_var_substitution(self, tmp_path, monkeypatch):
         """Test environment variable substitution."""
-        os.environ["TEST_ENDPOINT"] = "http://test-server:8000"
-        os.environ["TEST_API_KEY"] = "secret-key-123"
+        monkeypatch.setenv("TEST_ENDPOINT", "http://test-server:8000")
+        monkeypatch.setenv("TEST_API_KEY", "secret-key-123")
 
         yaml_content = """
 version: "1.0"
@@ -83,21 +76,22 @@ rag_system:
     Authorization: "Bearer ${TEST_API_KEY}"
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            config = Config.from_yaml(temp_path)
+        config = Config.from_yaml(str(config_path))
 
-            assert config.rag_system.endpoint == "http://test-server:8000"
-            assert config.rag_system.headers["Authorization"] == "Bearer secret-key-123"
-        finally:
-            os.unlink(temp_path)
-            del os.environ["TEST_ENDPOINT"]
-            del os.environ["TEST_API_KEY"]
+        assert config.rag_system.endpoint == "http://test-server:8000"
+        assert config.rag_system.headers["Authorization"] == "Bearer secret-key-123"
 
     def test_missing_file(self):
         """Test error on missing config file."""
         with pytest.raises(FileNotFoundError):
             Config.from_yaml("/nonexistent/path/config.yml")
+
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    def test_invalid_concurrency(self, concurrency):
+        """Test concurrency below 1 is rejected when the config is built."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            Config(concurrency=concurrency)
+        assert "concurrency must be at least 1" in str(exc_info.value)
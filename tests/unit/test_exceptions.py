@@ -12,6 +12,15 @@ from rag_guardian.exceptions import (
     ValidationError,
 )
 
+CUSTOM_EXCEPTIONS = [
+    ConfigurationError,
+    DatasetError,
+    MetricComputationError,
+    IntegrationError,
+    ValidationError,
+    PipelineError,
+]
+
 
 class TestExceptionHierarchy:
     """Test exception inheritance and hierarchy."""
@@ -22,37 +31,13 @@ class TestExceptionHierarchy:
         assert str(error) == "base error"
         assert isinstance(error, Exception)
 
-    def test_configuration_error_inherits_base(self):
-        """Test ConfigurationError inherits from RAGGuardianError."""
-        error = ConfigurationError("config error")
+    @pytest.mark.parametrize("exc_cls", CUSTOM_EXCEPTIONS)
+    def test_inherits_base(self, exc_cls):
+        """Test each custom exception inherits from RAGGuardianError."""
+        error = exc_cls("error")
         assert isinstance(error, RAGGuardianError)
         assert isinstance(error, Exception)
 
-    def test_dataset_error_inherits_base(self):
-        """Test DatasetError inherits from RAGGuardianError."""
-        error = DatasetError("dataset error")
-        assert isinstance(error, RAGGuardianError)
-
-    def test_metric_computation_error_inherits_base(self):
-        """Test MetricComputationError inherits from RAGGuardianError."""
-        error = MetricComputationError("metric error")
-        assert isinstance(error, RAGGuardianError)
-
-    def test_integration_error_inherits_base(self):
-        """Test IntegrationError inherits from RAGGuardianError."""
-        error = IntegrationError("integration error")
-        assert isinstance(error, RAGGuardianError)
-
-    def test_validation_error_inherits_base(self):
-        """Test ValidationError inherits from RAGGuardianError."""
-        error = ValidationError("validation error")
-        assert isinstance(error, RAGGuardianError)
-
-    def test_pipeline_error_inherits_base(self):
-        """Test PipelineError inherits from RAGGuardianError."""
-        error = PipelineError("pipeline error")
-        assert isinstance(error, RAGGuardianError)
-
 
 class TestExceptionCatching:
     """Test exception catching patterns."""
@@ -67,90 +52,35 @@ class TestExceptionCatching:
         with pytest.raises(RAGGuardianError):
             raise ConfigurationError("config error")
 
-    def test_catch_any_rag_guardian_error(self):
+    @pytest.mark.parametrize("exc_cls", CUSTOM_EXCEPTIONS)
+    def test_catch_any_rag_guardian_error(self, exc_cls):
         """Test that all custom exceptions can be caught as RAGGuardianError."""
-        exceptions = [
-            ConfigurationError("test"),
-            DatasetError("test"),
-            MetricComputationError("test"),
-            IntegrationError("test"),
-            ValidationError("test"),
-            PipelineError("test"),
-        ]
-
-        for exc in exceptions:
-            with pytest.raises(RAGGuardianError):
-                raise exc
+        with pytest.raises(RAGGuardianError):
+            raise exc_cls("test")
 
 
 class TestExceptionUsage:
     """Test typical exception usage patterns."""
 
-    def test_configuration_error_usage(self):
-        """Test ConfigurationError in typical usage."""
-
-        def load_config(path: str):
-            if not path:
-                raise ConfigurationError("Config path cannot be empty")
-            return {}
-
-        with pytest.raises(ConfigurationError, match="cannot be empty"):
-            load_config("")
-
-    def test_dataset_error_usage(self):
-        """Test DatasetError in typical usage."""
-
-        def load_dataset(path: str):
-            if not path.endswith(".jsonl"):
-                raise DatasetError(f"Expected .jsonl file, got: {path}")
-            return []
-
-        with pytest.raises(DatasetError, match="Expected .jsonl"):
-            load_dataset("file.json")
-
-    def test_metric_computation_error_usage(self):
-        """Test MetricComputationError in typical usage."""
-
-        def compute_metric(value: float):
-            if value < 0 or value > 1:
-                raise MetricComputationError(f"Metric value must be between 0 and 1, got {value}")
-            return value
-
-        with pytest.raises(MetricComputationError, match="between 0 and 1"):
-            compute_metric(1.5)
-
-    def test_integration_error_usage(self):
-        """Test IntegrationError in typical usage."""
-
-        def execute_rag(adapter):
-            if adapter is None:
-                raise IntegrationError("RAG adapter cannot be None")
-            return {}
-
-        with pytest.raises(IntegrationError, match="cannot be None"):
-            execute_rag(None)
-
-    def test_pipeline_error_usage(self):
-        """Test PipelineError in typical usage."""
-
-        def run_pipeline(test_cases):
-            if not test_cases:
-                raise PipelineError("Cannot evaluate empty dataset")
-            return {}
-
-        with pytest.raises(PipelineError, match="empty dataset"):
-            run_pipeline([])
-
-    def test_validation_error_usage(self):
-        """Test ValidationError in typical usage."""
-
-        def validate_test_case(test_case):
-            if not test_case.get("question"):
-                raise ValidationError("Test case must have a question")
-            return test_case
-
-        with pytest.raises(ValidationError, match="must have a question"):
-            validate_test_case({})
+    @pytest.mark.parametrize(
+        ("exc_cls", "message", "match"),
+        [
+            (ConfigurationError, "Config path cannot be empty", "cannot be empty"),
+            (DatasetError, "Expected .jsonl file, got: file.json", "Expected .jsonl"),
+            (
+                MetricComputationError,
+                "Metric value must be between 0 and 1, got 1.5",
+                "between 0 and 1",
+            ),
+            (IntegrationError, "RAG adapter cannot be None", "cannot be None"),
+            (PipelineError, "Cannot evaluate empty dataset", "empty dataset"),
+            (ValidationError, "Test case must have a question", "must have a question"),
+        ],
+    )
+    def test_error_usage(self, exc_cls, message, match):
+        """Test raising each exception with a typical message."""
+        with pytest.raises(exc_cls, match=match):
+            raise exc_cls(message)
 
 
 class TestExceptionChaining:
@@ -1,7 +1,10 @@
 """Unit tests for HTML reporter."""
 
-import tempfile
-from pathlib import Path
+import re
+import shutil
+from collections import Counter
+
+import pytest
 
 from rag_guardian.core.types import (
     EvaluationResult,
@@ -12,11 +15,62 @@ from rag_guardian.core.types import (
 )
 from rag_guardian.reporting.html import HTMLReporter
 
+pytestmark = pytest.mark.html
+
+# Fields shared by every generated test case in the multiple-test-case report
+_CONST_TC_KW = {"expected_answer": "A"}
+_CONST_RAG_KW = {"answer": "A", "contexts": ["C"]}
+
+# Opening and closing html/head/body tags (not <header>)
+DOCUMENT_TAG_RE = re.compile(r"</?(?:html|head|body)\b")
+
+# (substring, case_sensitive) pairs expected in the rendered passing report
+EXPECTED_SUBSTRINGS = [
+    # Document structure
+    ("<!DOCTYPE html>", True),
+    ("<html", True),
+    ("</html>", True),
+    # Title and status
+    ("RAG Quality Report", True),
+    ("✅", True),
+    # Summary stats and metric values
+    ("Total Tests", True),
+    ("Pass Rate", True),
+    ("Faithfulness", True),
+    ("Groundedness", True),
+    ("0.92", True),
+    ("0.88", True),
+    # Metrics table
+    ("<table", True),
+    ("<thead", True),
+    ("<tbody", True),
+    ("metric", False),
+    ("score", False),
+    ("threshold", False),
+    ("progress", False),
+    # Styles and scripts
+    ("<style>", True),
+    ("</style>", True),
+    ("font-family", True),
+    ("background", True),
+    ("<script>", True),
+    ("</script>", True),
+]
+
+# (substring, case_sensitive) pairs expected in the rendered failing report
+EXPECTED_FAILED_SUBSTRINGS = [
+    ("❌", True),
+    ("failure", False),
+    ("Failed", True),
+    ("faithfulness failed", True),
+]
+
 
 class TestHTMLReporter:
     """Tests for HTMLReporter."""
 
-    def create_sample_results(self, passed: bool = True) -> EvaluationResult:
+    @staticmethod
+    def _build_sample_results(passed: bool) -> EvaluationResult:
         """Create sample evaluation results for testing."""
         test_case = TestCase(
             question="What is RAG?",
@@ -66,182 +120,91 @@ class TestHTMLReporter:
             },
         )
 
-    def test_generate_html_report(self):
-        """Test generating HTML report."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            # Verify file was created
-            assert Path(output_path).exists()
-
-            # Read and verify content
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for essential HTML structure
-            assert "<!DOCTYPE html>" in html
-            assert "<html" in html
-            assert "</html>" in html
-
-            # Check for title
-            assert "RAG Quality Report" in html
-
-            # Check for metrics
-            assert "Faithfulness" in html or "faithfulness" in html
-            assert "Groundedness" in html or "groundedness" in html
-
-            # Check for pass/fail status
-            assert "PASSED" in html or "✅" in html
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_report_with_custom_title(self):
-        """Test generating HTML with custom title."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path, title="Custom Test Report")
-
-            with open(output_path) as f:
-                html = f.read()
-
-            assert "Custom Test Report" in html
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_report_failed_status(self):
-        """Test HTML report for failed evaluation."""
-        results = self.create_sample_results(passed=False)
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for failure indicators
-            assert "FAILED" in html or "❌" in html
-            assert "failure" in html.lower()
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_contains_summary_stats(self):
-        """Test that HTML contains summary statistics."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for stat cards
-            assert "Total Tests" in html or "total" in html.lower()
-            assert "Pass Rate" in html or "pass" in html.lower()
-
-            # Check for metric values
-            assert "0.92" in html or "92" in html  # faithfulness score
-            assert "0.88" in html or "88" in html  # groundedness score
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_contains_metrics_table(self):
-        """Test that HTML contains metrics table."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for table structure
-            assert "<table" in html
-            assert "<thead" in html
-            assert "<tbody" in html
-
-            # Check for table headers
-            assert "Metric" in html or "metric" in html.lower()
-            assert "Score" in html or "score" in html.lower()
-            assert "Threshold" in html or "threshold" in html.lower()
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_contains_styles(self):
-        """Test that HTML contains CSS styles."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for style tag
-            assert "<style>" in html
-            assert "</style>" in html
-
-            # Check for common CSS properties
-            assert "font-family" in html or "color" in html
-            assert "background" in html
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_contains_javascript(self):
-        """Test that HTML contains JavaScript for interactivity."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_results_passed(cls):
+        """Build the passing sample results once for the whole class."""
+        return cls._build_sample_results(passed=True)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_results_failed(cls):
+        """Build the failing sample results once for the whole class."""
+        return cls._build_sample_results(passed=False)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def rendered_html_passed(cls, sample_results_passed):
+        """Render the passing sample results once for the whole class."""
+        return HTMLReporter.render(sample_results_passed)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def rendered_html_failed(cls, sample_results_failed):
+        """Render the failing sample results once for the whole class."""
+        return HTMLReporter.render(sample_results_failed)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def lowered_html_passed(cls, rendered_html_passed):
+        """Lower-case the passing report once for case-insensitive checks."""
+        return rendered_html_passed.lower()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def lowered_html_failed(cls, rendered_html_failed):
+        """Lower-case the failing report once for case-insensitive checks."""
+        return rendered_html_failed.lower()
+
+    @pytest.mark.parametrize("needle,case_sensitive", EXPECTED_SUBSTRINGS)
+    def test_contains(self, rendered_html_passed, lowered_html_passed, needle, case_sensitive):
+        """Test the passing report contains the expected markup and values."""
+        html = rendered_html_passed if case_sensitive else lowered_html_passed
+        assert needle in html
+
+    @pytest.mark.parametrize("needle,case_sensitive", EXPECTED_FAILED_SUBSTRINGS)
+    def test_failed_contains(
+        self, rendered_html_failed, lowered_html_failed, needle, case_sensitive
+    ):
+        """Test the failing report shows the failure status and reasons."""
+        html = rendered_html_failed if case_sensitive else lowered_html_failed
+        assert needle in html
+
+    def test_html_report_with_custom_title(self, sample_results_passed):
+        """Test rendering HTML with custom title."""
+        html = HTMLReporter.render(sample_results_passed, title="Custom Test Report")
+
+        assert "Custom Test Report" in html
+
+    def test_generate_writes_report(self, sample_results_passed, tmp_path):
+        """Test generate writes the rendered report to disk."""
+        output_path = tmp_path / "report.html"
+
+        HTMLReporter.generate(sample_results_passed, str(output_path))
+
+        html = output_path.read_text(encoding="utf-8")
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.endswith("</html>")
+        assert "Detailed Test Results" in html
+
+    def test_html_creates_directory(self, sample_results_passed, tmp_path):
+        """Test that HTML reporter creates parent directory if needed."""
+        output_path = tmp_path / "reports" / "subdir" / "report.html"
 
-            with open(output_path) as f:
-                html = f.read()
+        HTMLReporter.generate(sample_results_passed, str(output_path))
 
-            # Check for script tag
-            assert "<script>" in html
-            assert "</script>" in html
+        assert output_path.exists()
 
-        finally:
-            Path(output_path).unlink()
+    def test_html_recreates_removed_directory(self, sample_results_passed, tmp_path):
+        """Test a report directory deleted between runs is created again."""
+        reports_dir = tmp_path / "reports"
+        output_path = reports_dir / "report.html"
 
-    def test_html_creates_directory(self):
-        """Test that HTML reporter creates parent directory if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "reports" / "subdir" / "report.html"
+        HTMLReporter.generate(sample_results_passed, str(output_path))
+        shutil.rmtree(reports_dir)
+        HTMLReporter.generate(sample_results_passed, str(output_path))
 
-            results = self.create_sample_results()
-            HTMLReporter.generate(results, str(output_path))
-
-            assert output_path.exists()
+        assert output_path.exists()
 
     def test_html_with_multiple_test_cases(self):
         """Test HTML generation with multiple test cases."""
@@ -252,21 +215,17 @@ class TestHTMLReporter:
             ("Q3", False),
         ]
 
-        test_results = []
-        for question, passed in test_cases_data:
-            test_case = TestCase(question=question, expected_answer="A")
-            rag_output = RAGOutput(question=question, answer="A", contexts=["C"])
-            metric_scores = {
-                "faithfulness": MetricScore("faithfulness", 0.9 if passed else 0.6, passed, 0.8)
-            }
-            test_results.append(
-                TestCaseResult(
-                    test_case=test_case,
-                    rag_output=rag_output,
-                    metric_scores=metric_scores,
-                    passed=passed,
-                )
+        test_results = [
+            TestCaseResult(
+                test_case=TestCase(question=question, **_CONST_TC_KW),
+                rag_output=RAGOutput(question=question, **_CONST_RAG_KW),
+                metric_scores={
+                    "faithfulness": MetricScore("faithfulness", 0.9 if passed else 0.6, passed, 0.8)
+                },
+                passed=passed,
             )
+            for question, passed in test_cases_data
+        ]
 
         results = EvaluationResult(
             test_case_results=test_results,
@@ -274,82 +233,35 @@ class TestHTMLReporter:
             summary={"pass_rate": 2 / 3},
         )
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
+        html = HTMLReporter.render(results)
 
-            # Should show all test cases
-            assert "Q1" in html
-            assert "Q2" in html
-            assert "Q3" in html
+        # Should show all test cases
+        assert "Q1" in html
+        assert "Q2" in html
+        assert "Q3" in html
 
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_with_failures_section(self):
-        """Test that failures are shown in separate section."""
-        results = self.create_sample_results(passed=False)
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Should have failures section
-            assert "Failed" in html or "failure" in html.lower()
-            assert "faithfulness failed" in html
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_progress_bars(self):
-        """Test that progress bars are included."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
-
-            # Check for progress bar classes
-            assert "progress" in html.lower()
-
-        finally:
-            Path(output_path).unlink()
-
-    def test_html_is_valid(self):
+    def test_html_is_valid(self, rendered_html_passed):
         """Test that generated HTML is valid (basic check)."""
-        results = self.create_sample_results()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
-            output_path = f.name
-
-        try:
-            HTMLReporter.generate(results, output_path)
-
-            with open(output_path) as f:
-                html = f.read()
+        html = rendered_html_passed
+
+        # Basic HTML validation: each document tag opens and closes exactly once
+        tags = Counter(DOCUMENT_TAG_RE.findall(html))
+        assert tags == {
+            "<html": 1,
+            "</html": 1,
+            "<head": 1,
+            "</head": 1,
+            "<body": 1,
+            "</body": 1,
+        }
 
-            # Basic HTML validation
-            assert html.count("<html") == 1
-            assert html.count("</html>") == 1
-            assert html.count("<head>") == 1
-            assert html.count("</head>") == 1
-            assert html.count("<body") == 1
-            assert html.count("</body>") == 1
+    def test_minimal_html_report(self, sample_results_failed):
+        """Test minimal mode keeps the summary but skips per-test sections."""
+        html = "".join(HTMLReporter._iter_html(sample_results_failed, "Quick Report", minimal=True))
 
-        finally:
-            Path(output_path).unlink()
+        assert "Quick Report" in html
+        assert "Metrics Summary" in html
+        assert "Detailed Test Results" not in html
+        assert "faithfulness failed" not in html
+        assert "<script>" not in html
+        assert html.count("</html>") == 1
@@ -0,0 +1,62 @@
+"""Unit tests for JSON reporters."""
+
+import pytest
+
+from rag_guardian.core.types import (
+    EvaluationResult,
+    MetricScore,
+    RAGOutput,
+    TestCase,
+    TestCaseResult,
+)
+from rag_guardian.reporting import json as json_reporting
+from rag_guardian.reporting.json import CompactJSONReporter, JSONReporter
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run the test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_reporting, "orjson", None)
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def sample_results():
+    """Create evaluation result whose metadata has non-string keys."""
+    test_result = TestCaseResult(
+        test_case=TestCase(question="Q", metadata={1: "one", "lang": "pl"}),
+        rag_output=RAGOutput(question="Q", answer="A", contexts=["C"]),
+        metric_scores={"faithfulness": MetricScore("faithfulness", 0.9, True, 0.8)},
+        passed=True,
+    )
+    return EvaluationResult(
+        test_case_results=[test_result],
+        passed=True,
+        summary={"pass_rate": 1.0},
+    )
+
+
+class TestJSONReporter:
+    """Tests for JSONReporter and CompactJSONReporter."""
+
+    def test_save_non_str_metadata_keys(self, json_backend, sample_results, tmp_path):
+        """Test both backends write non-string metadata keys as strings."""
+        output_path = tmp_path / "results.json"
+
+        JSONReporter.save(sample_results, str(output_path))
+
+        loaded = JSONReporter.load(str(output_path))
+        assert loaded["test_results"][0]["metadata"] == {"1": "one", "lang": "pl"}
+        assert loaded["total_tests"] == 1
+
+    def test_compact_save(self, json_backend, sample_results, tmp_path):
+        """Test both backends write the compact report on a single line."""
+        output_path = tmp_path / "results.json"
+
+        CompactJSONReporter.save(sample_results, str(output_path))
+
+        assert "\n" not in output_path.read_text(encoding="utf-8")
+        assert JSONReporter.load(str(output_path))["summary"] == {"pass_rate": 1.0}
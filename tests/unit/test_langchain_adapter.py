@@ -1,5 +1,7 @@
 """Unit tests for LangChain adapters."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from rag_guardian.integrations.langchain import (
@@ -7,10 +9,23 @@ from rag_guardian.integrations.langchain import (
     LangChainRetrievalQAAdapter,
 )
 
+pytestmark = pytest.mark.langchain
+
+
+def raising(exc: Exception):
+    """Return a callable that raises exc whatever it is called with."""
+
+    def fail(*args, **kwargs):
+        raise exc
+
+    return fail
+
 
 class MockDocument:
     """Mock LangChain document."""
 
+    __slots__ = ("page_content",)
+
     def __init__(self, page_content: str):
         self.page_content = page_content
 
@@ -87,11 +102,9 @@ class TestLangChainAdapter:
     def test_extract_answer_from_dict(self):
         """Test extracting answer from different dict keys."""
 
-        class ChainWithResult:
-            def invoke(self, inputs: dict):
-                return {"result": "Test result"}
+        chain = SimpleNamespace(invoke=lambda inputs: {"result": "Test result"})
 
-        adapter = LangChainAdapter(ChainWithResult())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
         assert "Test result" in result.answer
 
@@ -109,12 +122,9 @@ class TestLangChainAdapter:
     def test_fallback_to_retriever(self):
         """Test fallback to retriever when no sources in response."""
 
-        class ChainNoSources:
-            def invoke(self, inputs: dict):
-                return {"answer": "Test answer"}
-
+        chain = SimpleNamespace(invoke=lambda inputs: {"answer": "Test answer"})
         retriever = MockRetriever()
-        adapter = LangChainAdapter(ChainNoSources(), retriever)
+        adapter = LangChainAdapter(chain, retriever)
 
         result = adapter.execute("test")
 
@@ -128,19 +138,16 @@ class TestLangChainRetrievalQAAdapter:
     def test_retrieval_qa_execution(self):
         """Test RetrievalQA chain execution."""
 
-        class MockRetrievalQA:
-            retriever = MockRetriever()
-
-            def invoke(self, inputs: dict):
-                return {
-                    "result": f"Answer to {inputs['query']}",
-                    "source_documents": [
-                        MockDocument("Source 1"),
-                        MockDocument("Source 2"),
-                    ],
-                }
-
-        chain = MockRetrievalQA()
+        chain = SimpleNamespace(
+            retriever=MockRetriever(),
+            invoke=lambda inputs: {
+                "result": f"Answer to {inputs['query']}",
+                "source_documents": [
+                    MockDocument("Source 1"),
+                    MockDocument("Source 2"),
+                ],
+            },
+        )
         adapter = LangChainRetrievalQAAdapter(chain)
 
         result = adapter.execute("test")
@@ -151,14 +158,10 @@ class TestLangChainRetrievalQAAdapter:
     def test_extraction_from_retriever(self):
         """Test that retriever is properly extracted."""
 
-        class QAChain:
-            def __init__(self):
-                self.retriever = MockRetriever()
-
-            def invoke(self, inputs: dict):
-                return {"result": "Answer"}
-
-        chain = QAChain()
+        chain = SimpleNamespace(
+            retriever=MockRetriever(),
+            invoke=lambda inputs: {"result": "Answer"},
+        )
         adapter = LangChainRetrievalQAAdapter(chain)
 
         # Should have extracted retriever
@@ -174,11 +177,9 @@ class TestErrorHandling:
     def test_chain_execution_error(self):
         """Test handling of chain execution errors."""
 
-        class FailingChain:
-            def invoke(self, inputs: dict):
-                raise Exception("Chain failed!")
+        chain = SimpleNamespace(invoke=raising(Exception("Chain failed!")))
 
-        adapter = LangChainAdapter(FailingChain())
+        adapter = LangChainAdapter(chain)
 
         with pytest.raises(RuntimeError, match="LangChain execution failed"):
             adapter.execute("test")
@@ -186,12 +187,10 @@ class TestErrorHandling:
     def test_retriever_error(self):
         """Test handling of retriever errors."""
 
-        class FailingRetriever:
-            def get_relevant_documents(self, query: str):
-                raise Exception("Retrieval failed!")
+        retriever = SimpleNamespace(get_relevant_documents=raising(Exception("Retrieval failed!")))
 
         chain = MockChain()
-        adapter = LangChainAdapter(chain, FailingRetriever())
+        adapter = LangChainAdapter(chain, retriever)
 
         # Should handle error gracefully and return empty
         contexts = adapter.retrieve("test")
@@ -204,11 +203,9 @@ class TestResponseFormats:
     def test_string_response(self):
         """Test chain returning string instead of dict."""
 
-        class StringChain:
-            def invoke(self, inputs: dict):
-                return "Just a string answer"
+        chain = SimpleNamespace(invoke=lambda inputs: "Just a string answer")
 
-        adapter = LangChainAdapter(StringChain())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
 
         assert "Just a string answer" in result.answer
@@ -216,11 +213,9 @@ class TestResponseFormats:
     def test_response_with_text_key(self):
         """Test response with 'text' key."""
 
-        class TextKeyChain:
-            def invoke(self, inputs: dict):
-                return {"text": "Answer via text key"}
+        chain = SimpleNamespace(invoke=lambda inputs: {"text": "Answer via text key"})
 
-        adapter = LangChainAdapter(TextKeyChain())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
 
         assert "Answer via text key" in result.answer
@@ -228,11 +223,9 @@ class TestResponseFormats:
     def test_response_with_output_key(self):
         """Test response with 'output' key."""
 
-        class OutputKeyChain:
-            def invoke(self, inputs: dict):
-                return {"output": "Answer via output key"}
+        chain = SimpleNamespace(invoke=lambda inputs: {"output": "Answer via output key"})
 
-        adapter = LangChainAdapter(OutputKeyChain())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
 
         assert "Answer via output key" in result.answer
@@ -240,14 +233,14 @@ class TestResponseFormats:
     def test_contexts_as_strings(self):
         """Test when source documents are strings instead of Document objects."""
 
-        class StringDocsChain:
-            def invoke(self, inputs: dict):
-                return {
-                    "answer": "Test",
-                    "source_documents": ["String context 1", "String context 2"],
-                }
+        chain = SimpleNamespace(
+            invoke=lambda inputs: {
+                "answer": "Test",
+                "source_documents": ["String context 1", "String context 2"],
+            }
+        )
 
-        adapter = LangChainAdapter(StringDocsChain())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
 
         assert len(result.contexts) >= 2
@@ -255,14 +248,14 @@ class TestResponseFormats:
     def test_contexts_with_sources_key(self):
         """Test extracting contexts from 'sources' key."""
 
-        class SourcesKeyChain:
-            def invoke(self, inputs: dict):
-                return {
-                    "answer": "Test",
-                    "sources": [MockDocument("Source via sources key")],
-                }
+        chain = SimpleNamespace(
+            invoke=lambda inputs: {
+                "answer": "Test",
+                "sources": [MockDocument("Source via sources key")],
+            }
+        )
 
-        adapter = LangChainAdapter(SourcesKeyChain())
+        adapter = LangChainAdapter(chain)
         result = adapter.execute("test")
 
         assert len(result.contexts) >= 1
@@ -274,14 +267,10 @@ class TestRetrieverExtraction:
     def test_extract_from_retriever_attribute(self):
         """Test extracting from chain.retriever."""
 
-        class ChainWithRetriever:
-            def __init__(self):
-                self.retriever = MockRetriever()
-
-            def invoke(self, inputs: dict):
-                return {"answer": "Test"}
-
-        chain = ChainWithRetriever()
+        chain = SimpleNamespace(
+            retriever=MockRetriever(),
+            invoke=lambda inputs: {"answer": "Test"},
+        )
         adapter = LangChainAdapter(chain)
 
         # Should auto-extract retriever
@@ -291,11 +280,7 @@ class TestRetrieverExtraction:
     def test_no_retriever_available(self):
         """Test when chain has no retriever."""
 
-        class ChainWithoutRetriever:
-            def invoke(self, inputs: dict):
-                return {"answer": "Test"}
-
-        chain = ChainWithoutRetriever()
+        chain = SimpleNamespace(invoke=lambda inputs: {"answer": "Test"})
         adapter = LangChainAdapter(chain)
 
         # Should handle gracefully
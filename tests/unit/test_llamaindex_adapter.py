@@ -1,5 +1,7 @@
 """Unit tests for LlamaIndex adapters."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from rag_guardian.integrations.llamaindex import (
@@ -8,10 +10,23 @@ from rag_guardian.integrations.llamaindex import (
     LlamaIndexVectorStoreAdapter,
 )
 
+pytestmark = pytest.mark.llamaindex
+
+
+def raising(exc: Exception):
+    """Return a callable that raises exc whatever it is called with."""
+
+    def fail(*args, **kwargs):
+        raise exc
+
+    return fail
+
 
 class MockNode:
     """Mock LlamaIndex node."""
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str):
         self.text = text
 
@@ -19,6 +34,8 @@ class MockNode:
 class MockNodeWithScore:
     """Mock node with score."""
 
+    __slots__ = ("node", "score")
+
     def __init__(self, node: MockNode, score: float = 0.8):
         self.node = node
         self.score = score
@@ -27,6 +44,8 @@ class MockNodeWithScore:
 class MockResponse:
     """Mock LlamaIndex response."""
 
+    __slots__ = ("response", "source_nodes")
+
     def __init__(self, response: str, source_nodes=None):
         self.response = response
         self.source_nodes = source_nodes or []
@@ -116,14 +135,10 @@ class TestLlamaIndexVectorStoreAdapter:
     def test_initialization(self):
         """Test adapter initialization from index."""
 
-        class MockIndex:
-            def as_query_engine(self, **kwargs):
-                return MockQueryEngine()
-
-            def as_retriever(self, **kwargs):
-                return MockRetriever()
-
-        index = MockIndex()
+        index = SimpleNamespace(
+            as_query_engine=lambda **kwargs: MockQueryEngine(),
+            as_retriever=lambda **kwargs: MockRetriever(),
+        )
         adapter = LlamaIndexVectorStoreAdapter(index, similarity_top_k=5)
 
         assert adapter.query_kwargs == {"similarity_top_k": 5}
@@ -139,14 +154,12 @@ class TestLlamaIndexChatEngineAdapter:
     def test_chat_execution(self):
         """Test chat engine execution."""
 
-        class MockChatEngine:
-            def chat(self, message: str):
-                return MockResponse(
-                    f"Chat response to: {message}",
-                    [MockNodeWithScore(MockNode("Chat context"))],
-                )
-
-        engine = MockChatEngine()
+        engine = SimpleNamespace(
+            chat=lambda message: MockResponse(
+                f"Chat response to: {message}",
+                [MockNodeWithScore(MockNode("Chat context"))],
+            )
+        )
         adapter = LlamaIndexChatEngineAdapter(engine)
 
         result = adapter.execute("Hello")
@@ -157,11 +170,7 @@ class TestLlamaIndexChatEngineAdapter:
     def test_chat_without_sources(self):
         """Test chat when no source nodes available."""
 
-        class MockChatEngineNoSources:
-            def chat(self, message: str):
-                return MockResponse(f"Response: {message}", [])
-
-        engine = MockChatEngineNoSources()
+        engine = SimpleNamespace(chat=lambda message: MockResponse(f"Response: {message}", []))
         adapter = LlamaIndexChatEngineAdapter(engine)
 
         result = adapter.execute("test")
@@ -173,11 +182,7 @@ class TestLlamaIndexChatEngineAdapter:
     def test_retrieve_not_supported(self):
         """Test that retrieve returns empty for chat engines."""
 
-        class MockChatEngine:
-            def chat(self, message: str):
-                return MockResponse("response", [])
-
-        engine = MockChatEngine()
+        engine = SimpleNamespace(chat=lambda message: MockResponse("response", []))
         adapter = LlamaIndexChatEngineAdapter(engine)
 
         contexts = adapter.retrieve("test")
@@ -190,11 +195,7 @@ class TestErrorHandling:
     def test_query_engine_error(self):
         """Test handling of query engine errors."""
 
-        class FailingEngine:
-            def query(self, query_str: str):
-                raise Exception("Query failed!")
-
-        engine = FailingEngine()
+        engine = SimpleNamespace(query=raising(Exception("Query failed!")))
         adapter = LlamaIndexAdapter(engine)
 
         with pytest.raises(RuntimeError, match="LlamaIndex execution failed"):
@@ -203,11 +204,7 @@ class TestErrorHandling:
     def test_chat_engine_error(self):
         """Test handling of chat engine errors."""
 
-        class FailingChatEngine:
-            def chat(self, message: str):
-                raise Exception("Chat failed!")
-
-        engine = FailingChatEngine()
+        engine = SimpleNamespace(chat=raising(Exception("Chat failed!")))
         adapter = LlamaIndexChatEngineAdapter(engine)
 
         with pytest.raises(RuntimeError, match="Chat execution failed"):
@@ -220,16 +217,9 @@ class TestResponseParsing:
     def test_response_with_text_attribute(self):
         """Test parsing response with 'text' attribute."""
 
-        class ResponseWithText:
-            def __init__(self, text: str):
-                self.text = text
-                self.source_nodes = []
-
-        class EngineWithTextResponse:
-            def query(self, query_str: str):
-                return ResponseWithText(f"Answer: {query_str}")
-
-        engine = EngineWithTextResponse()
+        engine = SimpleNamespace(
+            query=lambda query_str: SimpleNamespace(text=f"Answer: {query_str}", source_nodes=[])
+        )
         adapter = LlamaIndexAdapter(engine)
 
         result = adapter.execute("test")
@@ -238,16 +228,9 @@ class TestResponseParsing:
     def test_response_with_answer_attribute(self):
         """Test parsing response with 'answer' attribute."""
 
-        class ResponseWithAnswer:
-            def __init__(self, answer: str):
-                self.answer = answer
-                self.source_nodes = []
-
-        class EngineWithAnswerResponse:
-            def query(self, query_str: str):
-                return ResponseWithAnswer(f"Answer: {query_str}")
-
-        engine = EngineWithAnswerResponse()
+        engine = SimpleNamespace(
+            query=lambda query_str: SimpleNamespace(answer=f"Answer: {query_str}", source_nodes=[])
+        )
         adapter = LlamaIndexAdapter(engine)
 
         result = adapter.execute("test")
@@ -256,20 +239,9 @@ class TestResponseParsing:
     def test_node_with_get_text_method(self):
         """Test nodes with get_text() method instead of text attribute."""
 
-        class NodeWithMethod:
-            def get_text(self):
-                return "Text from method"
-
-        class ResponseWithMethodNodes:
-            def __init__(self):
-                self.response = "Answer"
-                self.source_nodes = [MockNodeWithScore(NodeWithMethod())]
-
-        class EngineWithMethodNodes:
-            def query(self, query_str: str):
-                return ResponseWithMethodNodes()
-
-        engine = EngineWithMethodNodes()
+        node = SimpleNamespace(get_text=lambda: "Text from method")
+        response = SimpleNamespace(response="Answer", source_nodes=[MockNodeWithScore(node)])
+        engine = SimpleNamespace(query=lambda query_str: response)
         adapter = LlamaIndexAdapter(engine)
 
         result = adapter.execute("test")
@@ -1,161 +1,204 @@
 """Unit tests for DataLoader."""
 
-import tempfile
+import io
+import json
 from pathlib import Path
 
 import pytest
 
+from rag_guardian.core import loader
 from rag_guardian.core.loader import DataLoader
 from rag_guardian.core.types import TestCase
 from rag_guardian.exceptions import DatasetError
 
+pytestmark = pytest.mark.io
+
 
 class TestDataLoader:
     """Tests for DataLoader."""
 
-    def test_load_valid_jsonl(self):
+    def test_load_valid_jsonl(self, all_cases):
         """Test loading valid JSONL file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write('{"question": "Q1", "expected_answer": "A1"}\n')
-            f.write('{"question": "Q2", "expected_answer": "A2", "metadata": {"cat": "test"}}\n')
-            path = f.name
-
-        try:
-            test_cases = DataLoader.load_jsonl(path)
-
-            assert len(test_cases) == 2
-            assert test_cases[0].question == "Q1"
-            assert test_cases[0].expected_answer == "A1"
-            assert test_cases[1].question == "Q2"
-            assert test_cases[1].metadata["cat"] == "test"
-        finally:
-            Path(path).unlink()
-
-    def test_load_with_empty_lines(self):
+        assert all_cases[0].question == "Q1"
+        assert all_cases[0].expected_answer == "A1"
+        assert all_cases[1].question == "Q2"
+        assert all_cases[1].metadata["cat"] == "test"
+
+    def test_load_with_empty_lines(self, all_cases):
         """Test loading JSONL with empty lines."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write('{"question": "Q1"}\n')
-            f.write("\n")  # Empty line
-            f.write('{"question": "Q2"}\n')
-            path = f.name
-
-        try:
-            test_cases = DataLoader.load_jsonl(path)
-            assert len(test_cases) == 2
-        finally:
-            Path(path).unlink()
-
-    def test_load_with_all_fields(self):
+        assert len(all_cases) == 3
+
+    def test_load_with_all_fields(self, all_cases):
         """Test loading test case with all optional fields."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write(
-                '{"question": "Q", "expected_answer": "A", "expected_contexts": ["C1"], '
-                '"acceptable_answers": ["A1", "A2"], "required_contexts": ["R1"], '
-                '"forbidden_contexts": ["F1"], "metadata": {"key": "value"}}\n'
-            )
-            path = f.name
-
-        try:
-            test_cases = DataLoader.load_jsonl(path)
-
-            assert len(test_cases) == 1
-            tc = test_cases[0]
-            assert tc.question == "Q"
-            assert tc.expected_answer == "A"
-            assert tc.expected_contexts == ["C1"]
-            assert tc.acceptable_answers == ["A1", "A2"]
-            assert tc.required_contexts == ["R1"]
-            assert tc.forbidden_contexts == ["F1"]
-            assert tc.metadata == {"key": "value"}
-        finally:
-            Path(path).unlink()
+        tc = all_cases[2]
+        assert tc.question == "Q"
+        assert tc.expected_answer == "A"
+        assert tc.expected_contexts == ["C1"]
+        assert tc.acceptable_answers == ["A1", "A2"]
+        assert tc.required_contexts == ["R1"]
+        assert tc.forbidden_contexts == ["F1"]
+        assert tc.metadata == {"key": "value"}
+
+    def test_load_pathlib_path(self, invalid_jsonl_path, tmp_path):
+        """Test a pathlib.Path is treated as a file path, not a stream."""
+        path = tmp_path / "cases.jsonl"
+        path.write_text('{"question": "Q1"}\n', encoding="utf-8")
+
+        assert DataLoader.load_jsonl(path)[0].question == "Q1"
+        assert next(DataLoader.iter_jsonl(invalid_jsonl_path)).question == "Q1"
+
+    def test_load_binary_stream(self):
+        """Test loading from a binary file-like object."""
+        stream = io.BytesIO(b'{"question": "Czym jest RAG?"}\n')
+
+        test_cases = DataLoader.load_jsonl(stream)
+
+        assert test_cases[0].question == "Czym jest RAG?"
+
+    def test_stdlib_json_fallback_matches_orjson(self, tmp_path, monkeypatch):
+        """Test the orjson fast path and the json fallback parse files identically."""
+        pytest.importorskip("orjson")
+        path = tmp_path / "cases.jsonl"
+        path.write_bytes(
+            '{"question": "Jak działa RAG?", "metadata": {"lang": "pl"}}\n'
+            "\n"
+            '{"question": "Q2", "acceptable_answers": ["A1", "A2"]}\n'.encode()
+        )
+
+        fast_loaded = DataLoader.load_jsonl(str(path))
+        fast_iterated = list(DataLoader.iter_jsonl(str(path)))
+        monkeypatch.setattr(loader, "orjson", None)
+
+        assert DataLoader.load_jsonl(str(path)) == fast_loaded
+        assert list(DataLoader.iter_jsonl(str(path))) == fast_iterated == fast_loaded
+
+    def test_iter_jsonl_is_lazy(self, invalid_jsonl_path):
+        """Test iter_jsonl yields valid lines before reaching a bad one."""
+        cases = DataLoader.iter_jsonl(str(invalid_jsonl_path))
+
+        assert next(cases).question == "Q1"
+        with pytest.raises(DatasetError) as exc_info:
+            next(cases)
+        assert "Invalid JSON on line 2" in str(exc_info.value)
+
+    def test_iter_jsonl_validates_path_eagerly(self):
+        """Test iter_jsonl reports a missing file before iteration starts."""
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.iter_jsonl("/nonexistent/file.jsonl")
+        assert "Dataset file not found" in str(exc_info.value)
+
+    def test_skips_blank_lines(self, tmp_path):
+        """Test blank and CRLF lines are handled."""
+        path = tmp_path / "cases.jsonl"
+        path.write_bytes(b'{"question": "Q1"}\r\n\n   \n{"question": "Q2"}\n')
+
+        cases = DataLoader.load_jsonl(str(path))
+
+        assert [case.question for case in cases] == ["Q1", "Q2"]
+
+    def test_two_objects_on_one_line_rejected(self, tmp_path):
+        """Test lines that are not JSONL are rejected."""
+        path = tmp_path / "cases.jsonl"
+        path.write_text('{"question": "Q1"}, {"question": "Q2"}\n', encoding="utf-8")
+
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(str(path))
+        assert "Invalid JSON on line 1" in str(exc_info.value)
+
+    def test_multi_line_object_rejected(self, tmp_path):
+        """Test an object spread over several lines is not accepted as JSONL."""
+        path = tmp_path / "cases.jsonl"
+        # Two lines holding two objects, but neither line is a JSON value on its own
+        path.write_text(
+            '{"question": "Q1"}, {"question": "Q2"\n"expected_answer": "A2"}\n',
+            encoding="utf-8",
+        )
+
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(str(path))
+        assert "Invalid JSON on line 1" in str(exc_info.value)
 
     def test_missing_file(self):
         """Test error when file doesn't exist."""
-        with pytest.raises(DatasetError, match="Dataset file not found"):
+        with pytest.raises(DatasetError) as exc_info:
             DataLoader.load_jsonl("/nonexistent/file.jsonl")
+        assert "Dataset file not found" in str(exc_info.value)
 
-    def test_wrong_extension(self):
+    def test_wrong_extension(self, tmp_path):
         """Test error for non-JSONL file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            path = f.name
+        path = tmp_path / "cases.json"
+        path.touch()
 
-        try:
-            with pytest.raises(DatasetError, match="Expected .jsonl file"):
-                DataLoader.load_jsonl(path)
-        finally:
-            Path(path).unlink()
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(str(path))
+        assert "Expected .jsonl file" in str(exc_info.value)
 
-    def test_invalid_json(self):
+    def test_invalid_json(self, invalid_jsonl_path):
         """Test error on invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write('{"question": "Q1"}\n')
-            f.write("not valid json\n")
-            path = f.name
-
-        try:
-            with pytest.raises(DatasetError, match="Invalid JSON on line 2"):
-                DataLoader.load_jsonl(path)
-        finally:
-            Path(path).unlink()
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(str(invalid_jsonl_path))
+        assert "Invalid JSON on line 2" in str(exc_info.value)
 
     def test_missing_question_field(self):
         """Test error when question field is missing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write('{"expected_answer": "A"}\n')
-            path = f.name
+        stream = io.StringIO('{"expected_answer": "A"}\n')
 
-        try:
-            with pytest.raises(DatasetError, match="Missing required field 'question'"):
-                DataLoader.load_jsonl(path)
-        finally:
-            Path(path).unlink()
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(stream)
+        assert "Missing required field 'question'" in str(exc_info.value)
 
     def test_empty_file(self):
         """Test error on empty file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            path = f.name
-
-        try:
-            with pytest.raises(DatasetError, match="No valid test cases found"):
-                DataLoader.load_jsonl(path)
-        finally:
-            Path(path).unlink()
+        with pytest.raises(DatasetError) as exc_info:
+            DataLoader.load_jsonl(io.StringIO(""))
+        assert "No valid test cases found in <stream>" in str(exc_info.value)
 
-    def test_save_jsonl(self):
+    def test_save_jsonl(self, all_cases, tmp_path):
         """Test saving test cases to JSONL."""
-        test_cases = [
-            TestCase(question="Q1", expected_answer="A1", metadata={"cat": "test"}),
-            TestCase(
-                question="Q2",
-                expected_answer="A2",
-                acceptable_answers=["A2", "A3"],
-            ),
+        path = str(tmp_path / "cases.jsonl")
+        DataLoader.save_jsonl(all_cases, path)
+
+        # Verify saved records directly instead of re-running the loader
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"question": "Q1", "expected_answer": "A1", "expected_contexts": None, "metadata": {}},
+            {
+                "question": "Q2",
+                "expected_answer": "A2",
+                "expected_contexts": None,
+                "metadata": {"cat": "test"},
+            },
+            {
+                "question": "Q",
+                "expected_answer": "A",
+                "expected_contexts": ["C1"],
+                "metadata": {"key": "value"},
+                "acceptable_answers": ["A1", "A2"],
+                "required_contexts": ["R1"],
+                "forbidden_contexts": ["F1"],
+            },
         ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            path = f.name
+    def test_save_matches_without_orjson(self, tmp_path, monkeypatch):
+        """Test orjson and the json fallback write identical files, non-str keys included."""
+        pytest.importorskip("orjson")
+        test_cases = [TestCase(question="Jak działa RAG?", metadata={1: "one", "lang": "pl"})]
+        fast_path = tmp_path / "orjson.jsonl"
+        fallback_path = tmp_path / "json.jsonl"
 
-        try:
-            DataLoader.save_jsonl(test_cases, path)
+        DataLoader.save_jsonl(test_cases, str(fast_path))
+        monkeypatch.setattr(loader, "orjson", None)
+        DataLoader.save_jsonl(test_cases, str(fallback_path))
 
-            # Verify saved content
-            loaded = DataLoader.load_jsonl(path)
-            assert len(loaded) == 2
-            assert loaded[0].question == "Q1"
-            assert loaded[0].metadata["cat"] == "test"
-            assert loaded[1].acceptable_answers == ["A2", "A3"]
-        finally:
-            Path(path).unlink()
+        assert fast_path.read_bytes() == fallback_path.read_bytes()
+        assert DataLoader.load_jsonl(fast_path)[0].metadata == {"1": "one", "lang": "pl"}
 
-    def test_save_creates_directory(self):
+    def test_save_creates_directory(self, all_cases, tmp_path):
         """Test that save creates parent directory if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "subdir" / "test.jsonl"
+        path = tmp_path / "subdir" / "test.jsonl"
 
-            test_cases = [TestCase(question="Q1")]
-            DataLoader.save_jsonl(test_cases, str(path))
+        DataLoader.save_jsonl(all_cases[:1], str(path))
 
-            assert path.exists()
-            loaded = DataLoader.load_jsonl(str(path))
-            assert len(loaded) == 1
+        assert path.exists()
+        loaded = DataLoader.load_jsonl(str(path))
+        assert len(loaded) == 1
@@ -0,0 +1,504 @@
+"""Unit tests for logging utilities."""
+
+import io
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from rag_guardian.utils import logging as logging_utils
+from rag_guardian.utils.logging import (
+    DATE_FORMAT,
+    LOG_FORMAT,
+    LOG_SYNC_ENV_VAR,
+    ROOT_LOGGER_NAME,
+    _BufferedFileHandler,
+    _BufferedStreamHandler,
+    _CachedTimeFormatter,
+    _file_handlers,
+    _get_listener,
+    _queue_handler,
+    _TimedMemoryHandler,
+    debug_enabled,
+    disable_logging,
+    enable_file_logging,
+    get_logger,
+    info_enabled,
+    reload_env_level,
+    set_log_level,
+)
+
+
+def make_record(level: int = logging.INFO, msg: str = "message") -> logging.LogRecord:
+    """Create a log record for handler tests."""
+    return logging.LogRecord("rag_guardian.test", level, __file__, 1, msg, None, None)
+
+
+class TestTimedMemoryHandler:
+    """Tests for buffered console handler."""
+
+    def test_buffers_until_flush(self):
+        """Test records are held back until flushed."""
+        stream = io.StringIO()
+        handler = _TimedMemoryHandler(logging.StreamHandler(stream), flush_interval=60)
+
+        handler.handle(make_record(msg="buffered"))
+        assert stream.getvalue() == ""
+
+        handler.flush()
+        assert "buffered" in stream.getvalue()
+        handler.close()
+
+    def test_warning_flushes_immediately(self):
+        """Test WARNING records flush the buffer right away."""
+        stream = io.StringIO()
+        handler = _TimedMemoryHandler(logging.StreamHandler(stream), flush_interval=60)
+
+        handler.handle(make_record(msg="first"))
+        handler.handle(make_record(logging.WARNING, msg="boom"))
+
+        output = stream.getvalue()
+        assert "first" in output
+        assert "boom" in output
+        handler.close()
+
+    def test_capacity_flushes(self):
+        """Test a full buffer is flushed."""
+        stream = io.StringIO()
+        handler = _TimedMemoryHandler(logging.StreamHandler(stream), capacity=2, flush_interval=60)
+
+        handler.handle(make_record(msg="one"))
+        handler.handle(make_record(msg="two"))
+
+        assert "two" in stream.getvalue()
+        handler.close()
+
+    def test_burst_written_in_one_write(self):
+        """Test a buffered stream target receives the whole burst at once."""
+        writes = []
+
+        class RecordingStream(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        stream = RecordingStream()
+        handler = _TimedMemoryHandler(_BufferedStreamHandler(stream), flush_interval=60)
+
+        for i in range(5):
+            handler.handle(make_record(msg=f"record {i}"))
+        handler.flush()
+
+        assert len(writes) == 1
+        assert stream.getvalue().count("\n") == 5
+        handler.close()
+
+    def test_timer_flushes(self):
+        """Test buffered records are flushed after the interval."""
+        stream = io.StringIO()
+        handler = _TimedMemoryHandler(logging.StreamHandler(stream), flush_interval=0.01)
+
+        handler.handle(make_record(msg="later"))
+        handler._timer.join(timeout=1)
+
+        assert "later" in stream.getvalue()
+        handler.close()
+
+
+class TestBufferedFileHandler:
+    """Tests for buffered file logging."""
+
+    def test_info_is_buffered_until_flush(self, tmp_path):
+        """Test INFO records stay in the write buffer until flushed."""
+        log_file = tmp_path / "rag.log"
+        handler = _BufferedFileHandler(str(log_file), encoding="utf-8")
+
+        handler.handle(make_record(msg="quiet"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.flush()
+        assert "quiet" in log_file.read_text(encoding="utf-8")
+        handler.close()
+
+    def test_writes_utf8_bytes(self, tmp_path):
+        """Test non-ASCII messages are encoded as UTF-8."""
+        log_file = tmp_path / "rag.log"
+        handler = _BufferedFileHandler(str(log_file), encoding="utf-8")
+
+        handler.handle(make_record(msg="zażółć ✅"))
+        handler.flush()
+
+        assert "zażółć ✅" in log_file.read_bytes().decode("utf-8")
+        handler.close()
+
+    def test_warning_is_flushed(self, tmp_path):
+        """Test WARNING records are written immediately."""
+        log_file = tmp_path / "rag.log"
+        handler = _BufferedFileHandler(str(log_file), encoding="utf-8")
+
+        handler.handle(make_record(logging.WARNING, msg="loud"))
+
+        assert "loud" in log_file.read_text(encoding="utf-8")
+        handler.close()
+
+
+def drain_listener() -> None:
+    """Wait for queued records to be handled and flush the output handlers."""
+    listener = _get_listener()
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+    listener.start()
+
+
+@pytest.fixture
+def file_logging_cleanup():
+    """Detach and close file handlers registered during a test."""
+    yield
+    listener = _get_listener()
+    handlers = list(_file_handlers.values())
+    listener.handlers = tuple(h for h in listener.handlers if h not in handlers)
+    for handler in handlers:
+        target = handler.target
+        handler.close()
+        target.close()
+    _file_handlers.clear()
+
+
+@pytest.mark.usefixtures("file_logging_cleanup")
+class TestFileLogging:
+    """Tests for enable_file_logging."""
+
+    def test_records_reach_log_file(self, tmp_path):
+        """Test records from existing loggers are written to the file."""
+        log_file = tmp_path / "rag.log"
+        logger = get_logger("rag_guardian.tests.file_logging")
+        enable_file_logging(str(log_file))
+
+        logger.info("written to file")
+        drain_listener()
+
+        assert "written to file" in log_file.read_text(encoding="utf-8")
+
+    def test_info_reaches_file_without_explicit_flush(self, tmp_path):
+        """Test the timed flush writes INFO records to disk shortly after logging."""
+        log_file = tmp_path / "rag.log"
+        logger = get_logger("rag_guardian.tests.file_logging_timed")
+        enable_file_logging(str(log_file))
+
+        logger.info("flushed by timer")
+
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            if log_file.exists() and "flushed by timer" in log_file.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        assert "flushed by timer" in log_file.read_text(encoding="utf-8")
+
+    def test_same_path_reuses_handler(self, tmp_path):
+        """Test enabling the same file twice writes each record once."""
+        log_file = tmp_path / "rag.log"
+        logger = get_logger("rag_guardian.tests.file_logging_dedup")
+        enable_file_logging(str(log_file))
+        enable_file_logging(str(log_file))
+
+        logger.info("only once")
+        drain_listener()
+
+        assert len(_file_handlers) == 1
+        assert log_file.read_text(encoding="utf-8").count("only once") == 1
+
+    def test_concurrent_enable_registers_once(self, tmp_path):
+        """Test concurrent calls for one file register a single handler."""
+        log_file = str(tmp_path / "rag.log")
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            enable_file_logging(log_file)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        file_handlers = [h for h in _get_listener().handlers if h in _file_handlers.values()]
+        assert len(file_handlers) == 1
+
+
+class TestGetLogger:
+    """Tests for get_logger."""
+
+    def test_returns_cached_logger(self):
+        """Test repeated calls return the same logger without extra handlers."""
+        first = get_logger("rag_guardian.tests.cached")
+        second = get_logger("rag_guardian.tests.cached")
+
+        assert first is second
+        assert first.handlers == []
+        assert first.propagate
+
+    def test_handlers_live_on_package_logger(self):
+        """Test module loggers share the handler on the package logger."""
+        get_logger("rag_guardian.tests.first")
+        get_logger("rag_guardian.tests.second")
+
+        assert logging.getLogger(ROOT_LOGGER_NAME).handlers.count(_queue_handler) == 1
+
+    def test_foreign_name_gets_own_handler(self):
+        """Test loggers outside the package are configured directly."""
+        logger = get_logger("rag_guardian_tests_foreign")
+
+        assert logger.handlers.count(_queue_handler) == 1
+        assert not logger.propagate
+
+    def test_level_override_on_cached_logger(self):
+        """Test an explicit level is applied to an already cached logger."""
+        logger = get_logger("rag_guardian.tests.level_override")
+        get_logger("rag_guardian.tests.level_override", level=logging.DEBUG)
+
+        assert logger.level == logging.DEBUG
+
+    def test_default_level_from_environment(self, monkeypatch):
+        """Test RAG_GUARDIAN_LOG_LEVEL is picked up after reload_env_level."""
+        monkeypatch.setenv("RAG_GUARDIAN_LOG_LEVEL", "debug")
+        reload_env_level()
+
+        try:
+            logger = get_logger("rag_guardian.tests.env_level")
+            assert logger.getEffectiveLevel() == logging.DEBUG
+        finally:
+            monkeypatch.delenv("RAG_GUARDIAN_LOG_LEVEL")
+            reload_env_level()
+
+    def test_concurrent_first_calls(self):
+        """Test concurrent first-time calls build a single logger."""
+        name = "rag_guardian_tests_concurrent"
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_logger(name))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(logger is results[0] for logger in results)
+        assert results[0].handlers.count(_queue_handler) == 1
+
+
+class TestCachedTimeFormatter:
+    """Tests for timestamp caching formatter."""
+
+    def test_matches_stdlib_formatter(self):
+        """Test output is identical to logging.Formatter."""
+        record = make_record(msg="same output")
+        formatter = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        reference = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+        assert formatter.format(record) == reference.format(record)
+
+    def test_matches_stdlib_formatter_with_args_and_exception(self):
+        """Test records with arguments and tracebacks format like the stdlib."""
+        formatter = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        reference = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+        record = make_record(msg="value=%s")
+        record.args = (42,)
+        assert formatter.format(record) == reference.format(record)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "rag_guardian.test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+        assert formatter.format(record) == reference.format(record)
+
+    def test_custom_format_uses_stdlib_path(self):
+        """Test formats other than LOG_FORMAT are still honoured."""
+        formatter = _CachedTimeFormatter("%(levelname)s:%(message)s", datefmt=DATE_FORMAT)
+
+        assert formatter.format(make_record(msg="custom")) == "INFO:custom"
+
+    def test_reuses_time_within_second(self):
+        """Test timestamp is only formatted once per second."""
+        formatter = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        first = make_record()
+        second = make_record()
+        second.created = int(first.created) + 0.999
+
+        formatter.format(first)
+        formatter.converter = None  # Would fail if strftime were called again
+
+        assert formatter.format(second).startswith(first.asctime)
+
+
+class TestLevelGates:
+    """Tests for debug_enabled/info_enabled."""
+
+    def test_follow_set_log_level(self):
+        """Test gates reflect the level set via set_log_level."""
+        try:
+            set_log_level("DEBUG")
+            assert debug_enabled()
+            assert info_enabled()
+
+            set_log_level("WARNING")
+            assert not debug_enabled()
+            assert not info_enabled()
+        finally:
+            set_log_level("INFO")
+
+    def test_disable_logging_closes_gates(self):
+        """Test disable_logging turns all gates off."""
+        try:
+            disable_logging()
+            assert not debug_enabled()
+            assert not info_enabled()
+        finally:
+            set_log_level("INFO")
+
+        assert info_enabled()
+
+    def test_reenabling_restores_loggers_built_while_disabled(self):
+        """Test loggers requested while disabled log again after set_log_level."""
+        try:
+            disable_logging()
+            module_logger = get_logger("rag_guardian.tests.late_module")
+            foreign_logger = get_logger("rag_guardian_tests_late_foreign")
+            assert not module_logger.isEnabledFor(logging.CRITICAL)
+            assert not foreign_logger.isEnabledFor(logging.CRITICAL)
+
+            set_log_level("DEBUG")
+            assert module_logger.name == "rag_guardian.tests.late_module"
+            assert module_logger.isEnabledFor(logging.DEBUG)
+            assert foreign_logger.isEnabledFor(logging.DEBUG)
+        finally:
+            set_log_level("INFO")
+
+    def test_unknown_level_falls_back_to_info(self):
+        """Test unknown level names resolve to INFO."""
+        try:
+            set_log_level("verbose")
+            assert info_enabled()
+            assert not debug_enabled()
+        finally:
+            set_log_level("INFO")
+
+    def test_handlers_keep_default_level(self):
+        """Test set_log_level filters on loggers and leaves handlers at NOTSET."""
+        try:
+            set_log_level("ERROR")
+            assert _queue_handler.level == logging.NOTSET
+            assert logging.getLogger(ROOT_LOGGER_NAME).level == logging.ERROR
+        finally:
+            set_log_level("INFO")
+
+
+class TestSyncOutput:
+    """Tests for synchronous console output."""
+
+    @pytest.mark.parametrize("value,expected", [("1", True), ("0", False)])
+    def test_env_var(self, monkeypatch, value, expected):
+        """Test RAG_GUARDIAN_LOG_SYNC selects the output mode."""
+        monkeypatch.setattr(logging_utils, "_sync_output", logging_utils._sync_output)
+        monkeypatch.setenv(LOG_SYNC_ENV_VAR, value)
+
+        reload_env_level()
+
+        assert logging_utils._sync_output is expected
+
+    def test_defaults_to_sync_when_stdout_is_not_a_tty(self, monkeypatch):
+        """Test captured or piped stdout selects synchronous output."""
+        monkeypatch.delenv(LOG_SYNC_ENV_VAR, raising=False)
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+        assert logging_utils._read_env_sync()
+
+    @pytest.mark.parametrize("sync_output", [True, False], ids=["sync", "listener"])
+    def test_warning_written_before_call_returns(self, capsys, monkeypatch, sync_output):
+        """Test WARNING records reach stdout before the logging call returns."""
+        monkeypatch.setattr(logging_utils, "_sync_output", sync_output)
+        logger = get_logger("rag_guardian.tests.sync_output")
+
+        logger.warning("written now")
+
+        assert "written now" in capsys.readouterr().out
+
+
+def test_import_does_not_start_listener_thread():
+    """Test importing the package alone does not spawn the logging thread."""
+    code = (
+        "import threading, rag_guardian; "
+        "assert threading.active_count() == 1, threading.enumerate()"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize("sync", ["1", "0"], ids=["sync", "listener"])
+def test_forked_child_keeps_logging(sync):
+    """Test a child forked after the listener started still writes its records."""
+    code = """
+import os, sys
+from rag_guardian.utils.logging import get_logger
+
+logger = get_logger("rag_guardian.fork_test")
+logger.warning("parent before fork")
+pid = os.fork()
+if pid == 0:
+    logger.warning("child warning")
+    logger.info("child info")
+    sys.exit(0)
+os.waitpid(pid, 0)
+"""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore::DeprecationWarning", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, LOG_SYNC_ENV_VAR: sync},
+    )
+
+    assert "child warning" in result.stdout
+    assert "child info" in result.stdout
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize("sync", ["1", "0"], ids=["sync", "listener"])
+def test_fork_does_not_duplicate_buffered_records(tmp_path, sync):
+    """Test records buffered at fork time are written once, not again by the child."""
+    log_file = tmp_path / "fork.log"
+    code = """
+import os, sys, time
+from rag_guardian.utils.logging import enable_file_logging, get_logger
+
+enable_file_logging(sys.argv[1])
+logger = get_logger("rag_guardian.fork_test")
+logger.info("parent before fork")
+time.sleep(0.05)  # let the listener move the record into the handler buffers
+pid = os.fork()
+if pid == 0:
+    sys.exit(0)
+os.waitpid(pid, 0)
+"""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore::DeprecationWarning", "-c", code, str(log_file)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, LOG_SYNC_ENV_VAR: sync},
+    )
+
+    assert result.stdout.count("parent before fork") == 1
+    assert log_file.read_text(encoding="utf-8").count("parent before fork") == 1
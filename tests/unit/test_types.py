@@ -37,8 +37,17 @@ class TestTestCase:
 
     def test_empty_question_fails(self):
         """Test that empty question raises error."""
-        with pytest.raises(ValueError, match="Question cannot be empty"):
+        with pytest.raises(ValueError) as exc_info:
             TestCase(question="")
+        assert "Question cannot be empty" in str(exc_info.value)
+
+    def test_uses_slots(self):
+        """Test instances have no per-object __dict__."""
+        tc = TestCase(question="What is RAG?")
+
+        assert not hasattr(tc, "__dict__")
+        with pytest.raises(AttributeError):
+            tc.category = "basics"
 
 
 class TestRAGOutput:
@@ -71,13 +80,15 @@ class TestRAGOutput:
 
     def test_empty_answer_fails(self):
         """Test that empty answer raises error."""
-        with pytest.raises(ValueError, match="Answer cannot be empty"):
+        with pytest.raises(ValueError) as exc_info:
             RAGOutput(question="What is RAG?", answer="", contexts=["context"])
+        assert "Answer cannot be empty" in str(exc_info.value)
 
     def test_empty_contexts_fails(self):
         """Test that empty contexts raises error."""
-        with pytest.raises(ValueError, match="Contexts cannot be empty"):
+        with pytest.raises(ValueError) as exc_info:
             RAGOutput(question="What is RAG?", answer="Answer", contexts=[])
+        assert "Contexts cannot be empty" in str(exc_info.value)
 
 
 class TestMetricScore:
@@ -99,36 +110,48 @@ class TestMetricScore:
 
     def test_invalid_value_fails(self):
         """Test that value outside [0, 1] raises error."""
-        with pytest.raises(ValueError, match="Metric value must be between 0 and 1"):
+        with pytest.raises(ValueError) as exc_info:
             MetricScore(metric_name="test", value=1.5, passed=True)
+        assert "Metric value must be between 0 and 1" in str(exc_info.value)
 
-        with pytest.raises(ValueError, match="Metric value must be between 0 and 1"):
+        with pytest.raises(ValueError) as exc_info:
             MetricScore(metric_name="test", value=-0.1, passed=True)
+        assert "Metric value must be between 0 and 1" in str(exc_info.value)
+
+
+@pytest.fixture(scope="module")
+def basic_test_case():
+    """Create read-only test case shared by the module."""
+    return TestCase(question="Q")
+
+
+@pytest.fixture(scope="module")
+def basic_rag_output():
+    """Create read-only RAG output shared by the module."""
+    return RAGOutput(question="Q", answer="A", contexts=["C"])
+
+
+@pytest.fixture(scope="module")
+def faithfulness_score_pass():
+    """Create passing faithfulness score shared by the module."""
+    return MetricScore(metric_name="faithfulness", value=0.92, passed=True, threshold=0.85)
+
+
+@pytest.fixture(scope="module")
+def faithfulness_score_fail():
+    """Create failing faithfulness score shared by the module."""
+    return MetricScore(metric_name="faithfulness", value=0.70, passed=False, threshold=0.85)
 
 
 class TestEvaluationResult:
     """Tests for EvaluationResult."""
 
-    def test_basic_result(self):
+    def test_basic_result(self, basic_test_case, basic_rag_output, faithfulness_score_pass):
         """Test basic evaluation result."""
-        test_case = TestCase(question="What is RAG?")
-        rag_output = RAGOutput(
-            question="What is RAG?",
-            answer="Retrieval-Augmented Generation",
-            contexts=["RAG..."],
-        )
-
-        metric_score = MetricScore(
-            metric_name="faithfulness",
-            value=0.92,
-            passed=True,
-            threshold=0.85,
-        )
-
         test_result = TestCaseResult(
-            test_case=test_case,
-            rag_output=rag_output,
-            metric_scores={"faithfulness": metric_score},
+            test_case=basic_test_case,
+            rag_output=basic_rag_output,
+            metric_scores={"faithfulness": faithfulness_score_pass},
             passed=True,
         )
 
@@ -142,29 +165,26 @@ class TestEvaluationResult:
         assert eval_result.failed_tests == 0
         assert eval_result.pass_rate == 1.0
 
-    def test_mixed_results(self):
+    def test_mixed_results(self, faithfulness_score_pass, faithfulness_score_fail):
         """Test evaluation with mixed pass/fail."""
-        # Create 2 test cases - one pass, one fail
         test_case1 = TestCase(question="Question 1")
         test_case2 = TestCase(question="Question 2")
 
         rag_output1 = RAGOutput(question="Question 1", answer="Answer 1", contexts=["Context 1"])
         rag_output2 = RAGOutput(question="Question 2", answer="Answer 2", contexts=["Context 2"])
 
-        score1 = MetricScore(metric_name="faithfulness", value=0.92, passed=True, threshold=0.85)
-        score2 = MetricScore(metric_name="faithfulness", value=0.70, passed=False, threshold=0.85)
-
+        # Create 2 test results - one pass, one fail
         result1 = TestCaseResult(
             test_case=test_case1,
             rag_output=rag_output1,
-            metric_scores={"faithfulness": score1},
+            metric_scores={"faithfulness": faithfulness_score_pass},
             passed=True,
         )
 
         result2 = TestCaseResult(
             test_case=test_case2,
             rag_output=rag_output2,
-            metric_scores={"faithfulness": score2},
+            metric_scores={"faithfulness": faithfulness_score_fail},
             passed=False,
         )
 
@@ -200,3 +220,21 @@ class TestEvaluationResult:
 
         assert eval_result.avg_faithfulness == 0.9
         assert eval_result.avg_groundedness == 0.8
+
+    def test_avg_metrics_follow_results(
+        self, basic_test_case, basic_rag_output, faithfulness_score_pass, faithfulness_score_fail
+    ):
+        """Test averages reflect test case results added after construction."""
+        eval_result = EvaluationResult(test_case_results=[], passed=True)
+
+        for score in (faithfulness_score_pass, faithfulness_score_fail):
+            eval_result.test_case_results.append(
+                TestCaseResult(
+                    test_case=basic_test_case,
+                    rag_output=basic_rag_output,
+                    metric_scores={"faithfulness": score},
+                    passed=score.passed,
+                )
+            )
+
+        assert eval_result.avg_faithfulness == pytest.approx(0.81)